@@ -1,88 +1,86 @@
 #!/usr/bin/env python3
 """Test runner for Eagle platform."""
 
-import unittest
 import sys
 import os
+import pytest
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-def run_tests():
+TESTS_DIR = os.path.join(os.path.dirname(__file__), 'tests')
+
+_BAR = "=" * 70
+_RUN_HEADER = f"{_BAR}\nRunning Eagle Test Suite\n{_BAR}\n"
+_SUMMARY_HEADER = f"\n{_BAR}\nTest Summary\n{_BAR}\n"
+
+# Work stealing keeps every core busy when a few tests run long;
+# loadscope keeps each module/class on one worker so shared fixtures load once.
+DIST_MODES = ("worksteal", "loadscope")
+
+
+def _xdist_args(dist: str = "worksteal") -> list:
+    """Build pytest-xdist arguments, or run serially if the plugin is missing."""
+    try:
+        import xdist  # noqa: F401
+    except ImportError:
+        return []
+    return ["-n", "auto", "--dist", dist]
+
+
+def run_tests(dist: str = "worksteal"):
     """Run all Eagle tests."""
-    
-    # Discover and run tests
-    loader = unittest.TestLoader()
-    start_dir = os.path.join(os.path.dirname(__file__), 'tests')
-    suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    # Configure test runner
-    runner = unittest.TextTestRunner(
-        verbosity=2,
-        stream=sys.stdout,
-        buffer=True,  # Capture stdout/stderr during test runs
-        failfast=False  # Continue running tests after failures
-    )
-    
-    # Run tests
-    print("=" * 70)
-    print("Running Eagle Test Suite")
-    print("=" * 70)
-    
-    result = runner.run(suite)
-    
-    # Print summary
-    print("\n" + "=" * 70)
-    print("Test Summary")
-    print("=" * 70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
-    
-    if result.failures:
-        print(f"\nFailures:")
-        for test, traceback in result.failures:
-            print(f"  - {test}")
-    
-    if result.errors:
-        print(f"\nErrors:")
-        for test, traceback in result.errors:
-            print(f"  - {test}")
-    
+
+    sys.stdout.write(_RUN_HEADER)
+    sys.stdout.flush()
+
+    # Run tests in parallel across all available cores
+    exit_code = int(pytest.main([TESTS_DIR, "-v", *_xdist_args(dist)]))
+
+    # Print summary (pytest reports per-test results and the failure list above)
+    sys.stdout.write(_SUMMARY_HEADER)
+    print(f"Scheduler: {dist}")
+    print(f"Result: {'passed' if exit_code == 0 else f'failed (exit code {exit_code})'}")
+
     # Return exit code
-    return 0 if result.wasSuccessful() else 1
+    return exit_code
 
-def run_specific_test(test_module):
+def run_specific_test(test_module, dist: str = "worksteal"):
     """Run a specific test module."""
-    
-    try:
-        # Import the test module
-        if test_module.startswith('test_'):
-            module_name = f"tests.{test_module[:-3]}"  # Remove .py extension
-        else:
-            module_name = f"tests.test_{test_module}"
-        
-        suite = unittest.TestLoader().loadTestsFromName(module_name)
-        runner = unittest.TextTestRunner(verbosity=2)
-        result = runner.run(suite)
-        
-        return 0 if result.wasSuccessful() else 1
-        
-    except ImportError as e:
-        print(f"Error: Could not import test module '{test_module}': {e}")
+
+    if test_module.startswith('test_'):
+        module_file = test_module if test_module.endswith('.py') else f"{test_module}.py"
+    else:
+        module_file = f"test_{test_module}.py"
+
+    module_path = os.path.join(TESTS_DIR, module_file)
+    if not os.path.exists(module_path):
+        print(f"Error: Could not find test module '{test_module}': {module_path}")
         return 1
 
+    return int(pytest.main([module_path, "-v", *_xdist_args(dist)]))
+
 def main():
     """Main entry point for test runner."""
-    
-    if len(sys.argv) > 1:
+
+    args = sys.argv[1:]
+    dist = "worksteal"
+
+    # Optional scheduler override: --dist worksteal|loadscope
+    if "--dist" in args:
+        idx = args.index("--dist")
+        if idx + 1 >= len(args) or args[idx + 1] not in DIST_MODES:
+            print(f"Error: --dist must be one of: {', '.join(DIST_MODES)}")
+            return 1
+        dist = args[idx + 1]
+        del args[idx:idx + 2]
+
+    if args:
         # Run specific test
-        test_module = sys.argv[1]
-        return run_specific_test(test_module)
+        return run_specific_test(args[0], dist)
     else:
         # Run all tests
-        return run_tests()
+        return run_tests(dist)
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
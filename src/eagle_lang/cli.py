@@ -1,46 +1,221 @@
 # src/eagle_lang/cli.py
 import argparse
+import functools
 import os
 import sys
-from dotenv import load_dotenv
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict
 
 from .tools.base import tool_registry
-from .config import load_config
-from .interpreter import EagleInterpreter
-from .init import eagle_init, update_tools
+from .config import load_config, PROJECT_EAGLE_DIR, USER_EAGLE_DIR
 
-# Load environment variables from .env files in .eagle folders
-load_dotenv(os.path.join(os.getcwd(), ".eagle", ".env"))
-load_dotenv(os.path.expanduser("~/.eagle/.env"))
+# Heavy imports (dotenv, the interpreter and its LLM SDKs, init) are deferred
+# to the command paths that need them to keep CLI startup fast.
+
+# Path constants
+_PKG_DIR = os.path.dirname(__file__)
+_DEFAULT_TOOLS_DIR = os.path.join(_PKG_DIR, "default_config", "tools")
+_PROJECT_TOOLS_DIR = os.path.join(PROJECT_EAGLE_DIR, "tools")
+_USER_TOOLS_DIR = os.path.join(USER_EAGLE_DIR, "tools")
+_PROJECT_ENV_PATH = os.path.join(PROJECT_EAGLE_DIR, ".env")
+_USER_ENV_PATH = os.path.join(USER_EAGLE_DIR, ".env")
+
+
+def _load_env():
+    """Load environment variables from .env files in .eagle folders."""
+    from dotenv import load_dotenv
+    
+    load_dotenv(_PROJECT_ENV_PATH)
+    load_dotenv(_USER_ENV_PATH)
+
+
+# Set once tools have been loaded; the directory walk runs at most once per process
+_TOOLS_INITIALIZED = False
 
 
 # Initialize tools
 def _initialize_tools():
     """Initialize and register all available tools."""
-    # Load built-in tools from default_config/tools
-    default_tools_dir = os.path.join(os.path.dirname(__file__), "default_config", "tools")
-    tool_registry.load_tools_from_directory(default_tools_dir)
+    global _TOOLS_INITIALIZED
+    if _TOOLS_INITIALIZED:
+        return
     
-    # Load custom tools from .eagle/tools/ folders
-    project_tools_dir = os.path.join(os.getcwd(), ".eagle", "tools")
-    user_tools_dir = os.path.expanduser("~/.eagle/tools")
+    # Load built-in tools from default_config/tools
+    tool_registry.load_tools_from_directory(_DEFAULT_TOOLS_DIR)
     
-    # Load project-specific tools (can override defaults)
-    tool_registry.load_tools_from_directory(project_tools_dir)
+    # Load project-specific tools from .eagle/tools/ (can override defaults)
+    tool_registry.load_tools_from_directory(_PROJECT_TOOLS_DIR)
     
     # Load user-global tools (can override project and defaults)
-    tool_registry.load_tools_from_directory(user_tools_dir)
+    tool_registry.load_tools_from_directory(_USER_TOOLS_DIR)
+    
+    _TOOLS_INITIALIZED = True
+
+
+def _reset_tools():
+    """Unregister all tools so the next _initialize_tools() reloads them."""
+    global _TOOLS_INITIALIZED
+    _TOOLS_INITIALIZED = False
+    tool_registry.clear()
+    _capabilities_cached.cache_clear()
 
 
 # Don't initialize tools at module level - do it when needed
 
 
+_BAR60 = "=" * 60
+_BAR50 = "=" * 50
+
+_REPL_BANNER = "\n".join([
+    "🦅 Eagle Interactive Mode",
+    "Type your instructions in plain English and press Enter.",
+    "Commands: .exit (quit), .help (show help), .config (show config), .memory (show session)",
+    _BAR60,
+]) + "\n"
+
+_DETAILED_HEADER = f"\n{_BAR50}\nDETAILED TOOL INFORMATION\n{_BAR50}\n"
+
+_HELP_TEXT = "\n".join([
+    "Available commands:",
+    "  .exit/.quit  - Exit Eagle",
+    "  .help        - Show this help",
+    "  .config      - Show current configuration",
+    "  .capabilities - Show available tools and workflows",
+    "  .memory      - Show session history and context",
+    "  .forget      - Clear session memory",
+    "  .save-session - Save current session to file",
+    "  Or just type any instruction in plain English!",
+]) + "\n"
+
+
+def _preview(role: str, content: str) -> tuple:
+    """Build the (role label, truncated content) pair shown by .memory."""
+    label = "You" if role == "user" else "Eagle"
+    return label, content[:100] + "..." if len(content) > 100 else content
+
+
+@functools.lru_cache(maxsize=4)
+def _capabilities_cached(tools: tuple) -> str:
+    """Build the capabilities summary once per set of available tools."""
+    return tool_registry.get_user_capabilities_summary(list(tools))
+
+
+@dataclass
+class _ReplContext:
+    """State shared by REPL command handlers."""
+    config: Dict[str, Any]
+    provider: str
+    model: str
+    rules: Any
+    available_tools: tuple
+    # Session memory (keeps the last 50 messages)
+    session_history: deque = field(default_factory=lambda: deque(maxlen=50))
+    # .memory previews, kept in step with session_history
+    session_previews: deque = field(default_factory=lambda: deque(maxlen=50))
+    session_context: Dict[str, Any] = field(default_factory=dict)
+
+
+# Returned by a command handler to end the REPL
+_EXIT = object()
+
+
+def _cmd_exit(ctx: _ReplContext):
+    """Exit the REPL."""
+    print("Goodbye! 🦅")
+    return _EXIT
+
+
+def _cmd_help(ctx: _ReplContext):
+    """Show REPL help."""
+    sys.stdout.write(_HELP_TEXT)
+    sys.stdout.flush()
+
+
+def _cmd_config(ctx: _ReplContext):
+    """Show the current configuration."""
+    lines = [
+        f"Provider: {ctx.provider}",
+        f"Model: {ctx.model}",
+        f"Rules: {ctx.rules}",
+    ]
+    tools_config = ctx.config.get("tools", {})
+    if isinstance(tools_config, dict):
+        allowed = tools_config.get("allowed", [])
+        permission = tools_config.get("require_permission", [])
+        lines.append(f"Allowed tools: {', '.join(allowed) if allowed else 'None'}")
+        lines.append(f"Permission tools: {', '.join(permission) if permission else 'None'}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _cmd_capabilities(ctx: _ReplContext):
+    """Show available tools and workflows."""
+    print(_capabilities_cached(ctx.available_tools))
+
+
+def _cmd_memory(ctx: _ReplContext):
+    """Show session history and context."""
+    lines = [f"Session History ({len(ctx.session_history)} messages):"]
+    if not ctx.session_history:
+        lines.append("  No conversation history yet.")
+    else:
+        # Show last 10 messages
+        lines.extend(f"  {i+1}. {role}: {content}"
+                     for i, (role, content) in enumerate(list(ctx.session_previews)[-10:]))
+    
+    lines.append(f"\nSession Context ({len(ctx.session_context)} items):")
+    if not ctx.session_context:
+        lines.append("  No stored context yet.")
+    else:
+        lines.extend(f"  {key}: {str(value)[:100]}..." for key, value in ctx.session_context.items())
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _cmd_forget(ctx: _ReplContext):
+    """Clear session memory."""
+    ctx.session_history.clear()
+    ctx.session_previews.clear()
+    ctx.session_context.clear()
+    print("Session memory cleared.")
+
+
+def _cmd_save(ctx: _ReplContext):
+    """Save the current session to a JSON file."""
+    from datetime import datetime
+    from .config import _dump_json_file
+    
+    session_data = {
+        "timestamp": datetime.now().isoformat(),
+        "history": list(ctx.session_history),
+        "context": ctx.session_context
+    }
+    
+    filename = f"eagle_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    _dump_json_file(session_data, filename)
+    print(f"Session saved to {filename}")
+
+
+# REPL special commands
+_COMMANDS: Dict[str, Callable[[_ReplContext], Any]] = {
+    ".exit": _cmd_exit,
+    ".quit": _cmd_exit,
+    ".help": _cmd_help,
+    ".config": _cmd_config,
+    ".capabilities": _cmd_capabilities,
+    ".memory": _cmd_memory,
+    ".forget": _cmd_forget,
+    ".save-session": _cmd_save,
+}
+
+
 def start_interactive_mode():
     """Start Eagle's interactive REPL mode."""
-    print("🦅 Eagle Interactive Mode")
-    print("Type your instructions in plain English and press Enter.")
-    print("Commands: .exit (quit), .help (show help), .config (show config), .memory (show session)")
-    print("=" * 60)
+    from .interpreter import EagleInterpreter
+    
+    sys.stdout.write(_REPL_BANNER)
+    sys.stdout.flush()
     
     try:
         # Initialize tools
@@ -57,9 +232,20 @@ def start_interactive_mode():
             provider=provider, model_name=model, rules=rules, config=config
         )
         
-        # Initialize session memory
-        session_history = []
-        session_context = {}
+        # Tools and config don't change during a session, so resolve them once
+        tools_config = config.get("tools", {})
+        if isinstance(tools_config, dict):
+            available_tools = tools_config.get("allowed", []) + tools_config.get("require_permission", [])
+        else:
+            available_tools = tools_config if tools_config else []
+        
+        # Filter to only tools that actually exist
+        registered = tool_registry.names_set
+        available_tools = tuple(tool for tool in available_tools if tool in registered)
+        
+        ctx = _ReplContext(
+            config=config, provider=provider, model=model, rules=rules, available_tools=available_tools
+        )
         
         print(f"Ready! Using {provider}:{model}")
         print()
@@ -73,100 +259,27 @@ def start_interactive_mode():
                     continue
                 
                 # Handle special commands
-                if user_input == ".exit" or user_input == ".quit":
-                    print("Goodbye! 🦅")
-                    break
-                elif user_input == ".help":
-                    print("Available commands:")
-                    print("  .exit/.quit  - Exit Eagle")
-                    print("  .help        - Show this help")
-                    print("  .config      - Show current configuration")
-                    print("  .capabilities - Show available tools and workflows")
-                    print("  .memory      - Show session history and context")
-                    print("  .forget      - Clear session memory")
-                    print("  .save-session - Save current session to file")
-                    print("  Or just type any instruction in plain English!")
-                    continue
-                elif user_input == ".config":
-                    print(f"Provider: {provider}")
-                    print(f"Model: {model}")
-                    print(f"Rules: {rules}")
-                    tools_config = config.get("tools", {})
-                    if isinstance(tools_config, dict):
-                        allowed = tools_config.get("allowed", [])
-                        permission = tools_config.get("require_permission", [])
-                        print(f"Allowed tools: {', '.join(allowed) if allowed else 'None'}")
-                        print(f"Permission tools: {', '.join(permission) if permission else 'None'}")
-                    continue
-                elif user_input == ".capabilities":
-                    tools_config = config.get("tools", {})
-                    if isinstance(tools_config, dict):
-                        allowed_tools = tools_config.get("allowed", [])
-                        permission_tools = tools_config.get("require_permission", [])
-                        available_tools = allowed_tools + permission_tools
-                    else:
-                        available_tools = tools_config if tools_config else []
-                    
-                    # Filter to only tools that actually exist
-                    available_tools = [tool for tool in available_tools if tool in tool_registry.list_tools()]
-                    summary = tool_registry.get_user_capabilities_summary(available_tools)
-                    print(summary)
-                    continue
-                elif user_input == ".memory":
-                    print(f"Session History ({len(session_history)} messages):")
-                    if not session_history:
-                        print("  No conversation history yet.")
-                    else:
-                        for i, msg in enumerate(session_history[-10:]):  # Show last 10 messages
-                            role = "You" if msg["role"] == "user" else "Eagle"
-                            content = msg["content"][:100] + "..." if len(msg["content"]) > 100 else msg["content"]
-                            print(f"  {i+1}. {role}: {content}")
-                    
-                    print(f"\nSession Context ({len(session_context)} items):")
-                    if not session_context:
-                        print("  No stored context yet.")
-                    else:
-                        for key, value in session_context.items():
-                            print(f"  {key}: {str(value)[:100]}...")
-                    continue
-                elif user_input == ".forget":
-                    session_history.clear()
-                    session_context.clear()
-                    print("Session memory cleared.")
-                    continue
-                elif user_input == ".save-session":
-                    import json
-                    from datetime import datetime
-                    
-                    session_data = {
-                        "timestamp": datetime.now().isoformat(),
-                        "history": session_history,
-                        "context": session_context
-                    }
-                    
-                    filename = f"eagle_session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                    with open(filename, 'w') as f:
-                        json.dump(session_data, f, indent=2)
-                    print(f"Session saved to {filename}")
+                handler = _COMMANDS.get(user_input)
+                if handler:
+                    if handler(ctx) is _EXIT:
+                        break
                     continue
                 
                 # Execute the instruction
                 print("\n--- Eagle is thinking... ---")
                 try:
                     # Add user input to session history
-                    session_history.append({"role": "user", "content": user_input})
+                    ctx.session_history.append({"role": "user", "content": user_input})
+                    ctx.session_previews.append(_preview("user", user_input))
                     
                     # Get response with session history
-                    response = interpreter._get_llm_response(user_input, session_history=session_history)
+                    response = interpreter._get_llm_response(user_input, session_history=list(ctx.session_history))
                     print(f"\n{response}")
                     
-                    # Add response to session history
-                    session_history.append({"role": "assistant", "content": response})
+                    # Add response to session history (oldest messages drop off automatically)
+                    ctx.session_history.append({"role": "assistant", "content": response})
+                    ctx.session_previews.append(_preview("assistant", response))
                     
-                    # Limit history to prevent memory overflow (keep last 50 messages)
-                    if len(session_history) > 50:
-                        session_history = session_history[-50:]
-                        
                 except Exception as e:
                     print(f"\n❌ Error: {e}")
                 
@@ -184,10 +297,9 @@ def start_interactive_mode():
         print("Try running 'eagle init' to set up your configuration.")
 
 
-def main():
-    """
-    Entry point for the eagle command-line tool.
-    """
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the eagle argument parser (only needed when arguments are given)."""
     parser = argparse.ArgumentParser(
         prog="eagle",  # Set the program name for help messages
         description="Eagle: The natural language platform for orchestrating custom, evolving AI agents.",
@@ -199,7 +311,7 @@ def main():
     parser_run = subparsers.add_parser("run", help="Run a .caw file with optional context")
     parser_run.add_argument(
         "caw_file",
-        help="Path to the .caw file containing plain English instructions for Eagle.",
+        help="Path to the .caw file containing plain English instructions for Eagle ('-' reads from stdin).",
     )
     parser_run.add_argument(
         "--model",
@@ -242,6 +354,12 @@ def main():
         dest="global_install",
         help="Install configuration globally in home directory instead of current directory"
     )
+    parser_init.add_argument(
+        "--config-toml",
+        default=None,
+        metavar="PATH",
+        help="Answer every setup prompt from a TOML file (non-interactive; also read from $EAGLE_INIT_CONFIG)"
+    )
     
     # Update-tools subcommand
     parser_update_tools = subparsers.add_parser("update-tools", help="Update default tools while preserving custom tools")
@@ -253,25 +371,49 @@ def main():
         action="store_true",
         help="Show detailed information including potential workflows"
     )
+    
+    # Serve subcommand
+    parser_serve = subparsers.add_parser("serve", help="Run a long-lived agent worker for other Eagle processes")
+    parser_serve.add_argument(
+        "--stdio",
+        action="store_true",
+        required=True,
+        help="Exchange length-prefixed JSON jobs and results over stdin/stdout"
+    )
+
+    return parser
+
 
-    # Handle no arguments - start interactive mode
+def main():
+    """
+    Entry point for the eagle command-line tool.
+    """
+    # Handle no arguments - start interactive mode (no parser needed)
     if len(sys.argv) == 1:
+        _load_env()
         start_interactive_mode()
         return
 
     # If no subcommand, treat as run (for backward compatibility)
-    if len(sys.argv) > 1 and sys.argv[1] not in ("run", "init", "capabilities", "update-tools"):
+    if len(sys.argv) > 1 and sys.argv[1] not in ("run", "init", "capabilities", "update-tools", "serve"):
         # Check if first arg is a .caw file or other run argument
         # Insert 'run' as the default subcommand
         sys.argv.insert(1, "run")
 
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
 
     if args.command == "init":
-        eagle_init(global_install=getattr(args, 'global_install', False))
+        from .init import eagle_init
+        
+        # Pick up existing API keys so init can offer to keep them
+        _load_env()
+        eagle_init(global_install=getattr(args, 'global_install', False),
+                   config_path=getattr(args, 'config_toml', None))
         return
     
     if args.command == "update-tools":
+        from .init import update_tools
+        
         update_tools()
         return
     
@@ -292,16 +434,15 @@ def main():
                 available_tools = tools_config if tools_config else []
             
             # Filter to only tools that actually exist
-            available_tools = [tool for tool in available_tools if tool in tool_registry.list_tools()]
+            registered = tool_registry.names_set
+            available_tools = [tool for tool in available_tools if tool in registered]
             
             # Show capabilities
             summary = tool_registry.get_user_capabilities_summary(available_tools)
             print(summary)
             
             if getattr(args, 'detailed', False):
-                print("\n" + "="*50)
-                print("DETAILED TOOL INFORMATION")
-                print("="*50)
+                sys.stdout.write(_DETAILED_HEADER)
                 detailed_info = tool_registry.get_tool_patterns(available_tools)
                 print(detailed_info)
                 
@@ -309,6 +450,18 @@ def main():
             print("❌ No Eagle configuration found. Run 'eagle init' first.")
         return
 
+    if args.command == "serve":
+        from .serve import serve_stdio
+        
+        _load_env()
+        _initialize_tools()
+        serve_stdio()
+        return
+
+    from .interpreter import EagleInterpreter
+    
+    _load_env()
+    
     # Initialize tools for run command
     _initialize_tools()
     
@@ -326,7 +479,10 @@ def main():
         verbose=getattr(args, 'verbose', False),
         additional_context=additional_context
     )
-    interpreter.execute_caw_file(args.caw_file)
+    if args.caw_file == "-":
+        interpreter.execute_instructions(sys.stdin.read())
+    else:
+        interpreter.execute_caw_file(args.caw_file)
 
 
 if __name__ == "__main__":
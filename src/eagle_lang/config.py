@@ -1,9 +1,17 @@
 """Configuration management for Eagle."""
 
 import os
+import copy
 import json
+import functools
 from typing import Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # Configuration constants
 CONFIG_FILENAME = "eagle_config.json"
@@ -11,30 +19,63 @@ PROJECT_EAGLE_DIR = os.path.join(os.getcwd(), ".eagle")
 USER_EAGLE_DIR = os.path.expanduser("~/.eagle")
 PROJECT_CONFIG_PATH = os.path.join(PROJECT_EAGLE_DIR, CONFIG_FILENAME)
 USER_CONFIG_PATH = os.path.join(USER_EAGLE_DIR, CONFIG_FILENAME)
+DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), "default_config", CONFIG_FILENAME)
+
+
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json_file(obj: Any, path: str) -> None:
+    """Write a JSON file with 2-space indentation, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # Single-pass C serializer; non-string keys are stringified like json.dump does
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_json_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a JSON config file, cached per (path, mtime) so edits are picked up."""
+    return _load_json_file(path)
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    """Read a JSON config file, returning a private copy of the cached dict."""
+    return copy.deepcopy(_read_json_cached(path, os.stat(path).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_default_config() -> Dict[str, Any]:
+    """Parse the packaged default config once per process."""
+    # Load from default_config folder (should always exist)
+    return _load_json_file(DEFAULT_CONFIG_PATH)
 
 
 def get_default_config() -> Dict[str, Any]:
     """Get the default configuration values from default_config folder."""
-    # Path to default config file in the package
-    default_config_dir = os.path.join(os.path.dirname(__file__), "default_config")
-    default_config_path = os.path.join(default_config_dir, CONFIG_FILENAME)
-    
-    # Load from default_config folder (should always exist)
-    with open(default_config_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return copy.deepcopy(_load_default_config())
 
 
 def load_config(agent_name: str = None) -> Dict[str, Any]:
     """Load config from .eagle folder in project directory, user home directory, or defaults."""
-    # Check project config first, then user config, then use defaults
-    if os.path.exists(PROJECT_CONFIG_PATH):
-        with open(PROJECT_CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-        print(f"Loaded Eagle config from project: {PROJECT_CONFIG_PATH}")
-    elif os.path.exists(USER_CONFIG_PATH):
-        with open(USER_CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-        print(f"Loaded Eagle config from user home: {USER_CONFIG_PATH}")
+    # Check project config first, then user config, then use defaults.
+    # Try each file directly rather than checking it exists first (one stat per miss).
+    for path, label in ((PROJECT_CONFIG_PATH, "project"), (USER_CONFIG_PATH, "user home")):
+        try:
+            config = _read_json(path)
+        except FileNotFoundError:
+            continue
+        print(f"Loaded Eagle config from {label}: {path}")
+        break
     else:
         # Use default configuration
         config = get_default_config()
@@ -72,6 +113,5 @@ def save_config(config: Dict[str, Any], to_project: bool = True) -> None:
     # Create .eagle directory if it doesn't exist
     os.makedirs(config_dir, exist_ok=True)
     
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    _dump_json_file(config, config_path)
     print(f"Eagle config saved to: {config_path}")
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Ask permission tool for Eagle - gets user input or confirmation."""
 
 from typing import Dict, Any
-from eagle_lang.tools.base import EagleTool
+from eagle_lang.tools.base import EagleTool, tool_registry
 
 
 class AskPermissionTool(EagleTool):
@@ -41,6 +41,11 @@ class AskPermissionTool(EagleTool):
     
     def execute(self, prompt: str = "Press Enter to continue...", expect_response: bool = True, timeout: int = None) -> str:
         """Execute the wait tool."""
+        interpreter = tool_registry.get_interpreter()
+        if interpreter is not None and not getattr(interpreter, "interactive", True):
+            # e.g. an agent delegated by call_agent, whose output nobody is watching
+            return "No user available to respond: this agent is running non-interactively"
+        
         try:
             print(f"\n--- Eagle is waiting for your input ---")
             print(f"{prompt}")
@@ -71,6 +71,17 @@ class TestAskPermissionTool:
         assert "Error during wait" in result
         assert "Test error" in result
     
+    @patch('builtins.input')
+    @patch('builtins.print')
+    def test_execute_non_interactive_run(self, mock_print, mock_input):
+        """Test nothing is read from stdin when the running agent has no user to ask."""
+        with patch('eagle_lang.tools.base.tool_registry.get_interpreter',
+                   return_value=MagicMock(interactive=False)):
+            result = self.tool.execute(prompt="Continue?")
+        
+        assert "non-interactively" in result
+        mock_input.assert_not_called()
+    
     def test_parameter_schema(self):
         """Test parameter schema validation."""
         params = self.tool.parameters
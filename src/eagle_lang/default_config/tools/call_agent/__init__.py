@@ -1,22 +1,72 @@
 """Call Agent tool - allows delegating subtasks to specialized agents."""
 
+import io
 import os
+import sys
 import tempfile
+import threading
 import subprocess
-from typing import Dict, Any
-from eagle_lang.tools.base import EagleTool
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional, Tuple
+from eagle_lang.tools.base import EagleTool, tool_registry
+from eagle_lang.serve import read_message, run_instructions, write_message
+
+
+class _AgentWorker:
+    """Long-lived `eagle serve --stdio` process that runs isolated agent jobs one at a time."""
+    
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ['eagle', 'serve', '--stdio'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE
+        )
+    
+    def alive(self) -> bool:
+        return self.process.poll() is None
+    
+    def run(self, job: Dict[str, Any]) -> Tuple[int, str, str]:
+        """Send a job and relay its streamed output live until the worker reports its exit code."""
+        write_message(self.process.stdin, job)
+        
+        stdout_parts, stderr_parts = [], []
+        while True:
+            message = read_message(self.process.stdout)
+            if message is None:
+                raise EOFError("agent worker exited unexpectedly")
+            if "exit" in message:
+                return message["exit"], "".join(stdout_parts), "".join(stderr_parts)
+            
+            parts, sink = (stdout_parts, sys.stdout) if message.get("stream") == "stdout" else (stderr_parts, sys.stderr)
+            parts.append(message["data"])
+            sink.write(message["data"])
+            sink.flush()
+    
+    def close(self) -> None:
+        self.process.kill()
+        self.process.wait()
+        self.process.stdin.close()
+        self.process.stdout.close()
+
+
+# Shared worker for isolated calls, started on first use and replaced if it dies
+_worker: Optional[_AgentWorker] = None
+_worker_lock = threading.Lock()
 
 
 class CallAgentTool(EagleTool):
     """Tool for delegating subtasks to specialized agents."""
     
+    # Maximum time a delegated agent may run
+    timeout_seconds = 300
+    
     @property
     def name(self) -> str:
         return "call_agent"
     
     @property
     def description(self) -> str:
-        return "Delegate subtasks to specialized agents. Use this to break down complex tasks or leverage different agent capabilities."
+        return "Delegate subtasks to specialized agents. Use this to break down complex tasks or leverage different agent capabilities. Delegated agents cannot prompt the user, so tools that require permission are denied to them."
     
     @property
     def parameters(self) -> Dict[str, Any]:
@@ -48,82 +98,113 @@ class CallAgentTool(EagleTool):
                     "type": "boolean",
                     "description": "Whether to save the output to a temporary file for later reference",
                     "default": False
+                },
+                "isolated": {
+                    "type": "boolean",
+                    "description": "Run the agent in a separate, reused eagle worker process instead of in-process",
+                    "default": False
                 }
             },
             "required": ["instructions"]
         }
     
     def execute(self, instructions: str, agent: str = None, provider: str = None, model: str = None, 
-                rules: str = None, save_output: bool = False) -> str:
+                rules: str = None, save_output: bool = False, isolated: bool = False) -> str:
         """Execute the call_agent tool."""
+        if isolated:
+            return self._execute_isolated(instructions, agent, provider, model, rules, save_output)
+        
         try:
-            # Create temporary .caw file with instructions
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.caw', delete=False, encoding='utf-8') as temp_file:
-                temp_file.write(instructions)
-                temp_caw_path = temp_file.name
-            
-            # Build Eagle command
-            cmd = ['eagle', 'run', temp_caw_path]
-            
-            # Add optional parameters
-            if agent:
-                cmd.extend(['--agent', agent])
-            if provider:
-                cmd.extend(['--provider', provider])
-            if model:
-                cmd.extend(['--model', model])
-            if rules:
-                cmd.extend(['--rules', rules])
-            
-            # Execute Eagle command with interactive stdin for permission prompts
+            returncode, output, error = self._run_in_process(instructions, agent, provider, model, rules)
+        except FutureTimeoutError:
+            return f"Agent call timed out after {self.timeout_seconds} seconds"
+        except Exception as e:
+            return f"Error executing agent call: {str(e)}"
+        
+        return self._format_result(agent, returncode, output, error, save_output)
+    
+    def _run_in_process(self, instructions: str, agent: str, provider: str, model: str,
+                        rules: str) -> Tuple[int, str, str]:
+        """
+        Run the agent with an interpreter in this process, capturing its output.
+        
+        The agent runs non-interactively: its output is captured, so a prompt would never be
+        seen, and an agent abandoned on timeout must not be left reading the user's stdin.
+        """
+        stdout_buffer = io.StringIO()
+        stderr_buffer = io.StringIO()
+        cancel_event = threading.Event()
+        
+        def run() -> int:
+            return run_instructions(instructions, agent, provider, model, rules,
+                                    stdout=stdout_buffer, stderr=stderr_buffer,
+                                    cancel_event=cancel_event, interactive=False)
+        
+        parent_interpreter = tool_registry.get_interpreter()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            returncode = executor.submit(run).result(timeout=self.timeout_seconds)
+        except FutureTimeoutError:
+            # Threads cannot be killed; the agent stops at its next model request or tool call.
+            # Tools used from here on belong to the caller again, not the abandoned agent.
+            cancel_event.set()
+            tool_registry.set_interpreter(parent_interpreter)
+            raise
+        finally:
+            executor.shutdown(wait=False)
+        
+        return returncode, stdout_buffer.getvalue(), stderr_buffer.getvalue()
+    
+    def _format_result(self, agent: str, returncode: int, output: str, error: str, save_output: bool) -> str:
+        """Format a finished agent call for the calling agent."""
+        agent_name = agent if agent else "default agent"
+        if returncode != 0:
+            return f"Agent call to {agent_name} failed (exit code {returncode}):\n\nStdout:\n{output}\n\nStderr:\n{error}"
+        
+        response = f"Agent call to {agent_name} completed successfully:\n\n{output}"
+        
+        if save_output:
+            # Save output to a file; the output is already in memory, so a raw fd write is enough
+            fd, output_path = tempfile.mkstemp(suffix='.txt')
+            try:
+                os.write(fd, output.encode('utf-8'))
+            finally:
+                os.close(fd)
+            response += f"\n\nOutput saved to: {output_path}"
+        
+        return response
+    
+    def _execute_isolated(self, instructions: str, agent: str, provider: str, model: str,
+                          rules: str, save_output: bool) -> str:
+        """Run the agent in the shared `eagle serve --stdio` worker process."""
+        global _worker
+        
+        job = {"instructions": instructions, "agent": agent, "provider": provider,
+               "model": model, "rules": rules}
+        
+        with _worker_lock:
             try:
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    stdin=None,  # Inherit stdin to allow interactive prompts
-                    text=True,
-                    timeout=300,  # 5 minute timeout
-                    encoding='utf-8'
-                )
-                
-                output = result.stdout
-                error = result.stderr
-                
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_caw_path)
-                except:
-                    pass
-                
-                if result.returncode == 0:
-                    # Success
-                    agent_name = agent if agent else "default agent"
-                    response = f"Agent call to {agent_name} completed successfully:\n\n{output}"
-                    
-                    if save_output:
-                        # Save output to a file
-                        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as output_file:
-                            output_file.write(output)
-                            response += f"\n\nOutput saved to: {output_file.name}"
-                    
-                    return response
-                else:
-                    # Error
-                    agent_name = agent if agent else "default agent"
-                    return f"Agent call to {agent_name} failed (exit code {result.returncode}):\n\nStdout:\n{output}\n\nStderr:\n{error}"
-                    
-            except subprocess.TimeoutExpired:
-                return "Agent call timed out after 5 minutes"
+                if _worker is None or not _worker.alive():
+                    _worker = _AgentWorker()
             except FileNotFoundError:
                 return "Error: 'eagle' command not found. Make sure Eagle is installed and in your PATH."
+            except Exception as e:
+                return f"Error executing agent call: {str(e)}"
             
-        except Exception as e:
-            # Clean up temporary file if it exists
+            worker = _worker
+            executor = ThreadPoolExecutor(max_workers=1)
             try:
-                if 'temp_caw_path' in locals():
-                    os.unlink(temp_caw_path)
-            except:
-                pass
-            
-            return f"Error executing agent call: {str(e)}"
\ No newline at end of file
+                returncode, output, error = executor.submit(worker.run, job).result(timeout=self.timeout_seconds)
+            except FutureTimeoutError:
+                # A stuck worker cannot take more jobs; the next call starts a fresh one
+                worker.close()
+                _worker = None
+                return f"Agent call timed out after {self.timeout_seconds} seconds"
+            except Exception as e:
+                worker.close()
+                _worker = None
+                return f"Error executing agent call: {str(e)}"
+            finally:
+                executor.shutdown(wait=False)
+        
+        return self._format_result(agent, returncode, output, error, save_output)
@@ -0,0 +1,195 @@
+"""Tests for call_agent tool."""
+
+import io
+import os
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from eagle_lang.serve import read_message, write_message
+from eagle_lang.tools.base import tool_registry
+from . import CallAgentTool
+
+CALL_AGENT_MODULE = CallAgentTool.__module__
+
+AGENT_CONFIG = {"name": "helper", "provider": "openai", "model": "gpt-4o", "rules": ["base.md"]}
+
+
+def _worker_process(*messages) -> MagicMock:
+    """Build a mock `eagle serve --stdio` process that replies with the given messages."""
+    replies = io.BytesIO()
+    for message in messages:
+        write_message(replies, message)
+    replies.seek(0)
+    
+    process = MagicMock()
+    process.stdin = io.BytesIO()
+    process.stdout = replies
+    process.poll.return_value = None
+    return process
+
+
+class TestCallAgentTool(unittest.TestCase):
+    """Test cases for the call_agent tool."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tool = CallAgentTool()
+        # Every test starts without a running shared worker
+        worker_patch = patch(f'{CALL_AGENT_MODULE}._worker', None)
+        worker_patch.start()
+        self.addCleanup(worker_patch.stop)
+
+    def test_tool_properties(self):
+        """Test that tool has required properties."""
+        self.assertEqual(self.tool.name, "call_agent")
+        self.assertIsNotNone(self.tool.description)
+        self.assertIn("instructions", self.tool.parameters["required"])
+        self.assertIn("isolated", self.tool.parameters["properties"])
+
+    @patch('subprocess.Popen')
+    @patch('eagle_lang.config.load_config', return_value=dict(AGENT_CONFIG))
+    @patch('eagle_lang.interpreter.EagleInterpreter')
+    def test_runs_in_process(self, mock_interpreter, mock_load_config, mock_popen):
+        """Test the agent runs in this process and its output is captured."""
+        mock_interpreter.return_value.execute_instructions.side_effect = lambda text: print(f"did {text}")
+        parent = object()
+        tool_registry.set_interpreter(parent)
+
+        result = self.tool.execute("summarize", agent="helper", rules="a.md b.md")
+
+        self.assertIn("Agent call to helper completed successfully", result)
+        self.assertIn("did summarize", result)
+        mock_load_config.assert_called_once_with("helper")
+        self.assertEqual(mock_interpreter.call_args.kwargs["rules"], ["a.md", "b.md"])
+        # Captured output means nobody would see a prompt
+        self.assertIs(mock_interpreter.call_args.kwargs["interactive"], False)
+        self.assertIs(tool_registry.get_interpreter(), parent)
+        mock_popen.assert_not_called()
+
+    @patch('eagle_lang.config.load_config', return_value=dict(AGENT_CONFIG))
+    @patch('eagle_lang.interpreter.EagleInterpreter')
+    def test_in_process_exit_reported_as_failure(self, mock_interpreter, mock_load_config):
+        """Test interpreter exits map to a failed call with the exit code."""
+        def fail(text):
+            print("Error initializing openai client")
+            raise SystemExit(1)
+        mock_interpreter.return_value.execute_instructions.side_effect = fail
+
+        result = self.tool.execute("summarize")
+
+        self.assertIn("failed (exit code 1)", result)
+        self.assertIn("Error initializing openai client", result)
+
+    @patch('eagle_lang.config.load_config', return_value=dict(AGENT_CONFIG))
+    @patch('eagle_lang.interpreter.EagleInterpreter')
+    def test_timed_out_call_does_not_leak_into_next(self, mock_interpreter, mock_load_config):
+        """Test a timed-out agent is cancelled and its late output stays out of later calls."""
+        slow_started, slow_release, slow_done = threading.Event(), threading.Event(), threading.Event()
+        interpreters = []
+        
+        def make_interpreter(**kwargs):
+            interpreter = MagicMock()
+            interpreters.append(interpreter)
+            # Like a real interpreter, register for the tools it runs
+            tool_registry.set_interpreter(interpreter)
+            
+            def execute(text):
+                if text == "slow":
+                    slow_started.set()
+                    slow_release.wait(5)
+                    print("late output")
+                    slow_done.set()
+                else:
+                    # Let the timed-out agent print while this call is capturing
+                    slow_release.set()
+                    slow_done.wait(5)
+                    print("fast output")
+            interpreter.execute_instructions.side_effect = execute
+            return interpreter
+        mock_interpreter.side_effect = make_interpreter
+        self.tool.timeout_seconds = 0.1
+        
+        parent = object()
+        tool_registry.set_interpreter(parent)
+        
+        with patch('sys.stdout', new_callable=io.StringIO) as terminal:
+            timed_out = self.tool.execute("slow")
+            self.assertTrue(slow_started.is_set())
+            # The abandoned agent is still running, but tools now belong to the caller again
+            self.assertIs(tool_registry.get_interpreter(), parent)
+            self.tool.timeout_seconds = 5
+            result = self.tool.execute("fast")
+            print("after")
+        
+        self.assertEqual(timed_out, "Agent call timed out after 0.1 seconds")
+        self.assertTrue(interpreters[0].cancel_event.is_set())
+        self.assertIn("fast output", result)
+        self.assertNotIn("late output", result)
+        self.assertEqual(terminal.getvalue(), "after\n")
+    
+    @patch('subprocess.Popen')
+    def test_isolated_reuses_worker(self, mock_popen):
+        """Test isolated calls stream output from one shared eagle worker process."""
+        mock_popen.return_value = _worker_process(
+            {"stream": "stdout", "data": "line one\n"}, {"stream": "stdout", "data": "isolated output\n"},
+            {"exit": 0},
+            {"stream": "stdout", "data": "second\n"}, {"exit": 0},
+        )
+
+        with patch('sys.stdout', new_callable=io.StringIO) as live_output:
+            first = self.tool.execute("summarize", agent="helper", isolated=True)
+            second = self.tool.execute("again", isolated=True)
+
+        self.assertIn("line one\nisolated output", first)
+        self.assertIn("second", second)
+        self.assertEqual(live_output.getvalue(), "line one\nisolated output\nsecond\n")
+        mock_popen.assert_called_once()
+        self.assertEqual(mock_popen.call_args.args[0], ['eagle', 'serve', '--stdio'])
+
+        jobs = io.BytesIO(mock_popen.return_value.stdin.getvalue())
+        self.assertEqual(read_message(jobs)["agent"], "helper")
+        self.assertEqual(read_message(jobs)["instructions"], "again")
+
+    @patch('subprocess.Popen')
+    def test_isolated_failure_reports_exit_code(self, mock_popen):
+        """Test a failing isolated agent reports its exit code and stderr."""
+        mock_popen.return_value = _worker_process(
+            {"stream": "stdout", "data": "partial\n"}, {"stream": "stderr", "data": "boom\n"}, {"exit": 2})
+
+        with patch('sys.stdout', new_callable=io.StringIO), patch('sys.stderr', new_callable=io.StringIO):
+            result = self.tool.execute("summarize", isolated=True)
+
+        self.assertIn("failed (exit code 2)", result)
+        self.assertIn("boom", result)
+
+    @patch('subprocess.Popen')
+    def test_worker_restarted_after_crash(self, mock_popen):
+        """Test a worker that dies mid-job is replaced on the next call."""
+        crashed = _worker_process({"stream": "stdout", "data": "partial\n"})
+        mock_popen.side_effect = [crashed, _worker_process({"exit": 0})]
+
+        with patch('sys.stdout', new_callable=io.StringIO):
+            failed = self.tool.execute("summarize", isolated=True)
+            retried = self.tool.execute("summarize", isolated=True)
+
+        self.assertIn("agent worker exited unexpectedly", failed)
+        crashed.kill.assert_called_once()
+        self.assertIn("completed successfully", retried)
+        self.assertEqual(mock_popen.call_count, 2)
+
+    @patch('subprocess.Popen')
+    def test_save_output_writes_file(self, mock_popen):
+        """Test saved output lands in a temporary file named in the response."""
+        mock_popen.return_value = _worker_process({"stream": "stdout", "data": "saved output ✓"}, {"exit": 0})
+
+        with patch('sys.stdout', new_callable=io.StringIO):
+            result = self.tool.execute("summarize", save_output=True, isolated=True)
+
+        output_path = result.rsplit("Output saved to: ", 1)[1]
+        self.addCleanup(os.unlink, output_path)
+        with open(output_path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), "saved output ✓")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -473,6 +473,11 @@ Make sure the implementation is a single string with proper Python indentation u
     
     def _prompt_config_update(self, tool_name: str) -> str:
         """Prompt user to add tool to config and update automatically."""
+        from eagle_lang.tools.base import tool_registry
+        interpreter = tool_registry.get_interpreter()
+        if interpreter is not None and not getattr(interpreter, "interactive", True):
+            return "⚠️  Tool not added to config (no user to ask in a non-interactive run). Add manually to use."
+        
         try:
             print(f"\n🔧 Tool '{tool_name}' created! Where should it be added to your Eagle config?")
             print("1. Allowed tools (can be used freely)")
@@ -2,9 +2,21 @@
 
 import urllib.request
 import urllib.parse
-import json
+import hashlib
+import ipaddress
+import os
 import re
+import socket
+import time
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
 from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 from eagle_lang.tools.base import EagleTool, tool_registry
 
 try:
@@ -14,6 +26,168 @@ try:
 except ImportError:
     HTML_AVAILABLE = False
 
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+
+# Hosts that are never fetched: loopback aliases and cloud metadata endpoints
+_BLOCKED_HOSTS = frozenset({
+    "localhost",
+    "127.0.0.1",
+    "0.0.0.0",
+    "::1",
+    "metadata.google.internal",
+    "169.254.169.254",
+})
+
+
+_BAR50 = "=" * 50
+# Separates response metadata from the body in raw results
+_CONTENT_SEPARATOR = "\n" + _BAR50 + "\n"
+
+
+def _looks_like_json(data) -> bool:
+    """Guess whether a request body is JSON from its first non-whitespace character."""
+    if isinstance(data, bytes):
+        data = data[:64].decode('utf-8', errors='ignore')
+    for ch in data[:64]:
+        if ch in " \t\r\n":
+            continue
+        return ch in "{["
+    return False
+
+
+# Shared keep-alive connection pool; avoids a fresh TCP+TLS handshake per request
+_POOL = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=16,
+    # Redirects are followed by WebTool._open so every hop passes the sandbox checks
+    retries=urllib3.Retry(connect=0, read=0, redirect=0, raise_on_redirect=False),
+) if URLLIB3_AVAILABLE else None
+
+
+# Persistent response cache shared across Eagle runs; created on first use
+_DISK_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".eagle", "cache", "web")
+_DISK_CACHE_SIZE_LIMIT = 256 * 1024 * 1024
+# Set to 0/false/off to keep responses in memory only
+_DISK_CACHE_ENV = "EAGLE_WEB_DISK_CACHE"
+_DISK = None
+_DISK_LOCK = threading.Lock()
+
+
+def _disk_cache():
+    """Get the on-disk response cache, or None if diskcache is unavailable or disabled."""
+    global _DISK
+    if not DISKCACHE_AVAILABLE:
+        return None
+    if os.environ.get(_DISK_CACHE_ENV, "").strip().lower() in ("0", "false", "no", "off"):
+        return None
+    with _DISK_LOCK:
+        if _DISK is None:
+            try:
+                _DISK = diskcache.Cache(_DISK_CACHE_DIR, size_limit=_DISK_CACHE_SIZE_LIMIT)
+            except Exception:
+                # Unwritable home or broken cache dir: stay memory-only for this process
+                _DISK = False
+        return _DISK or None
+
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+# Request headers that must not follow a redirect to a different host
+_CREDENTIAL_HEADERS = frozenset({"authorization", "cookie", "proxy-authorization"})
+
+
+def _is_internal_address(ip) -> bool:
+    """Check if an IP address points into the local machine or network."""
+    if getattr(ip, 'ipv4_mapped', None):
+        ip = ip.ipv4_mapped
+    return ip.is_private or ip.is_loopback or ip.is_link_local or ip.is_unspecified
+
+
+class _NoRedirectHandler(urllib.request.HTTPRedirectHandler):
+    """Surface redirects as HTTPError instead of following them."""
+    
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+# urllib fallback (no urllib3, or a proxy is configured); proxy handling is kept
+_OPENER = urllib.request.build_opener(_NoRedirectHandler)
+
+
+class _BlockedRedirect(Exception):
+    """A redirect pointed at a URL the sandbox does not allow."""
+    
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.url = url
+
+
+def _uses_proxy(url: str) -> bool:
+    """Check whether the environment (HTTP(S)_PROXY/NO_PROXY) routes this URL through a proxy."""
+    parsed = urlparse(url)
+    proxies = urllib.request.getproxies()
+    if parsed.scheme not in proxies:
+        return False
+    return not urllib.request.proxy_bypass(parsed.hostname or "")
+
+
+@contextmanager
+def _translate_urllib3_errors():
+    """Re-raise urllib3 errors as the urllib equivalents handled by the web tool."""
+    try:
+        yield
+    except urllib3.exceptions.MaxRetryError as e:
+        if isinstance(e.reason, urllib3.exceptions.TimeoutError):
+            raise TimeoutError(str(e.reason)) from e
+        raise urllib.error.URLError(e.reason) from e
+    except urllib3.exceptions.TimeoutError as e:
+        raise TimeoutError(str(e)) from e
+    except urllib3.exceptions.HTTPError as e:
+        raise urllib.error.URLError(e) from e
+
+
+class _PooledResponse:
+    """Minimal urllib-style view of a streamed urllib3 response."""
+    
+    def __init__(self, response, url: str):
+        self._response = response
+        self._done = False
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+        # urllib3 may report only the path of the final (possibly redirected) request
+        self.url = urllib.parse.urljoin(url, getattr(response, 'url', None) or '')
+    
+    def read(self, amt: Optional[int] = None) -> bytes:
+        with _translate_urllib3_errors():
+            data = self._response.read(amt)
+        if amt is None or len(data) < amt:
+            self._done = True
+        return data
+    
+    def close(self) -> None:
+        # Fully read connections go back to the pool; partially read ones are dropped
+        if self._done:
+            self._response.release_conn()
+        else:
+            self._response.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class SimpleHTMLParser(HTMLParser):
     """Simple HTML parser to extract useful content."""
@@ -73,6 +247,28 @@ class SimpleHTMLParser(HTMLParser):
 class WebTool(EagleTool):
     """Tool for fetching web content and making HTTP requests."""
     
+    # Response cache limits for idempotent GET requests
+    cache_max_entries = 64
+    cache_max_bytes = 512 * 1024
+    # Without Cache-Control/Expires a response is never served fresh; it is only
+    # kept (if it has ETag/Last-Modified) so the next request can revalidate it
+    cache_default_ttl = 0
+    
+    # Response bodies are streamed in chunks of this size
+    read_chunk_size = 64 * 1024
+    
+    # Concurrent requests issued by execute_many (matches the connection pool size)
+    max_concurrency = 16
+    
+    # Redirect hops followed per request (urllib's HTTPRedirectHandler allows the same)
+    max_redirects = 10
+    
+    def __init__(self):
+        super().__init__()
+        # key -> (expires_at, result, etag, last_modified), least recently used first
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
     @property
     def name(self) -> str:
         return "web"
@@ -159,6 +355,21 @@ class WebTool(EagleTool):
         # Try to parse and extract relevant information
         return self._process_content(raw_content, purpose, url)
     
+    async def execute_many(self, requests: List[Dict[str, Any]]) -> List[str]:
+        """Execute several web requests concurrently.
+        
+        Each item holds the keyword arguments for execute(). Results are returned
+        in the same order as the requests.
+        """
+        if not requests:
+            return []
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(requests))) as executor:
+            futures = [loop.run_in_executor(executor, functools.partial(self.execute, **request))
+                       for request in requests]
+            return list(await asyncio.gather(*futures))
+    
     def _process_content(self, raw_content: str, purpose: str, url: str) -> str:
         """Process HTML content to extract relevant information."""
         if not HTML_AVAILABLE:
@@ -185,7 +396,7 @@ class WebTool(EagleTool):
             # Format results
             result = f"🌐 Web Content from {url}\n"
             result += f"📋 Purpose: {purpose}\n"
-            result += "=" * 50 + "\n"
+            result += _BAR50 + "\n"
             result += filtered_content
             
             return result
@@ -197,9 +408,8 @@ class WebTool(EagleTool):
     def _extract_html_from_response(self, raw_response: str) -> Optional[str]:
         """Extract HTML content from the raw HTTP response."""
         # Look for the content after the headers
-        separator = "\n" + "=" * 50 + "\n"
-        if separator in raw_response:
-            return raw_response.split(separator, 1)[1]
+        if _CONTENT_SEPARATOR in raw_response:
+            return raw_response.split(_CONTENT_SEPARATOR, 1)[1]
         return None
     
     def _filter_content_by_purpose(self, text: str, titles: List[str], links: List[str], purpose: str) -> str:
@@ -354,44 +564,76 @@ class WebTool(EagleTool):
             else:
                 data_bytes = None
             
-            # Create request
-            req = urllib.request.Request(url, data=data_bytes, method=method)
+            # Serve fresh GET responses from cache, or revalidate stale ones
+            cache_key = self._cache_key(method, url, headers, data, max_content_length)
+            cached = self._cache_lookup(cache_key) if cache_key else None
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            if cache_key and not cached:
+                persisted = self._disk_lookup(cache_key)
+                if persisted:
+                    return persisted
             
-            # Add headers
-            if headers:
-                for key, value in headers.items():
-                    req.add_header(key, value)
+            # Build headers
+            request_headers = dict(headers) if headers else {}
             
             # Add default User-Agent if not provided
-            if not headers or 'User-Agent' not in headers:
-                req.add_header('User-Agent', 'Eagle-WebTool/1.0')
+            if 'User-Agent' not in request_headers:
+                request_headers['User-Agent'] = 'Eagle-WebTool/1.0'
             
             # Add Content-Type for POST/PUT if data is provided and no Content-Type set
             if data_bytes and method in ['POST', 'PUT']:
-                if not headers or 'Content-Type' not in headers:
+                if 'Content-Type' not in request_headers:
                     # Try to detect if data is JSON
-                    try:
-                        json.loads(data)
-                        req.add_header('Content-Type', 'application/json')
-                    except (json.JSONDecodeError, TypeError):
-                        req.add_header('Content-Type', 'application/x-www-form-urlencoded')
+                    if _looks_like_json(data):
+                        request_headers['Content-Type'] = 'application/json'
+                    else:
+                        request_headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            
+            # Conditional GET: let the server answer 304 if our stale copy is still valid
+            if cached:
+                _, _, etag, last_modified = cached
+                given = {key.lower() for key in request_headers}
+                if etag and 'if-none-match' not in given:
+                    request_headers['If-None-Match'] = etag
+                if last_modified and 'if-modified-since' not in given:
+                    request_headers['If-Modified-Since'] = last_modified
             
             # Make request
-            with urllib.request.urlopen(req, timeout=timeout) as response:
+            try:
+                response = self._open(method, url, request_headers, data_bytes, timeout)
+            except urllib.error.HTTPError as e:
+                if e.code == 304 and cached:
+                    ttl = self._cache_ttl(e.headers)
+                    result = cached[1]
+                    with self._cache_lock:
+                        self._cache[cache_key] = (time.monotonic() + (ttl or 0), result,
+                                                  e.headers.get('ETag') or cached[2],
+                                                  e.headers.get('Last-Modified') or cached[3])
+                    return result
+                raise
+            
+            with response:
                 # Check content length
                 content_length = response.headers.get('Content-Length')
                 if content_length and int(content_length) > max_content_length:
                     return f"Content too large: {content_length} bytes (max: {max_content_length})"
                 
-                # Read response
-                content = response.read()
+                # Read response in chunks, stopping one byte past the limit
+                buf = bytearray()
+                limit = max_content_length + 1
+                while len(buf) < limit:
+                    chunk = response.read(min(self.read_chunk_size, limit - len(buf)))
+                    if not chunk:
+                        break
+                    buf.extend(chunk)
                 
                 # Limit content size
-                if len(content) > max_content_length:
-                    content = content[:max_content_length]
-                    truncated = True
-                else:
-                    truncated = False
+                truncated = len(buf) > max_content_length
+                if truncated:
+                    # Stop the download now rather than draining the rest of the body
+                    response.close()
+                content = bytes(buf[:max_content_length])
                 
                 # Try to decode as text
                 try:
@@ -404,18 +646,24 @@ class WebTool(EagleTool):
                 
                 # Build result
                 result = f"HTTP {response.status} {response.reason}\n"
-                result += f"URL: {response.url}\n"
+                result += f"URL: {response.url or url}\n"
                 result += f"Content-Type: {response.headers.get('Content-Type', 'unknown')}\n"
                 result += f"Content-Length: {len(content)} bytes\n"
                 
                 if truncated:
                     result += f"(Content truncated to {max_content_length} bytes)\n"
                 
-                result += "\n" + "=" * 50 + "\n"
+                result += _CONTENT_SEPARATOR
                 result += text_content
                 
+                if cache_key and response.status == 200 and len(content) <= self.cache_max_bytes:
+                    self._cache_store(cache_key, result, response.headers)
+                    self._disk_store(cache_key, result, response.headers)
+                
                 return result
                 
+        except _BlockedRedirect as e:
+            return f"Access denied: redirect blocked for security: {e.url}\nURL: {url}"
         except urllib.error.HTTPError as e:
             return f"HTTP Error {e.code}: {e.reason}\nURL: {url}"
         except urllib.error.URLError as e:
@@ -425,21 +673,201 @@ class WebTool(EagleTool):
         except Exception as e:
             return f"Error making request: {str(e)}\nURL: {url}"
     
+    def _open(self, method: str, url: str, headers: Dict[str, str], data_bytes: Optional[bytes], timeout: int):
+        """Open an HTTP response, following redirects by hand so every hop is checked by _is_safe_url."""
+        for _ in range(self.max_redirects + 1):
+            try:
+                return self._open_once(method, url, headers, data_bytes, timeout)
+            except urllib.error.HTTPError as e:
+                location = e.headers.get('Location') if e.code in _REDIRECT_CODES else None
+                if not location:
+                    raise
+                code = e.code
+                e.close()
+            
+            next_url = urllib.parse.urljoin(url, location)
+            if not self._is_safe_url(next_url):
+                raise _BlockedRedirect(next_url)
+            
+            if urlparse(next_url).hostname != urlparse(url).hostname:
+                headers = {k: v for k, v in headers.items() if k.lower() not in _CREDENTIAL_HEADERS}
+            # Same method rewriting as urllib: 303, and 301/302 after a POST, become a bodiless GET
+            if code == 303 or (code in (301, 302) and method not in ('GET', 'HEAD')):
+                method, data_bytes = 'GET', None
+                headers = {k: v for k, v in headers.items() if k.lower() != 'content-type'}
+            url = next_url
+        
+        raise urllib.error.URLError(f"too many redirects (more than {self.max_redirects})")
+    
+    def _open_once(self, method: str, url: str, headers: Dict[str, str], data_bytes: Optional[bytes], timeout: int):
+        """Make a single request, reusing pooled keep-alive connections when urllib3 is available."""
+        # The pool connects directly, so proxied requests go through urllib, which honours proxy settings
+        if _POOL is None or _uses_proxy(url):
+            req = urllib.request.Request(url, data=data_bytes, headers=headers, method=method)
+            return _OPENER.open(req, timeout=timeout)
+        
+        with _translate_urllib3_errors():
+            response = _POOL.request(method, url, headers=headers, body=data_bytes, timeout=timeout,
+                                     preload_content=False, redirect=False)
+        
+        # Match urllib semantics: redirects and non-success statuses surface as HTTPError
+        if response.status == 304 or response.status in _REDIRECT_CODES or response.status >= 400:
+            response.drain_conn()
+            response.release_conn()
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+        
+        return _PooledResponse(response, url)
+    
+    def _cache_key(self, method: str, url: str, headers: Dict[str, str], data: str,
+                   max_content_length: int) -> Optional[tuple]:
+        """Build the response cache key, or None if the request is not cacheable."""
+        if method != 'GET':
+            return None
+        return (method, url, frozenset(headers.items()) if headers else None, data, max_content_length)
+    
+    def _cache_ttl(self, response_headers) -> Optional[int]:
+        """Get freshness lifetime in seconds from response headers, or None if not cacheable."""
+        cache_control = (response_headers.get('Cache-Control') or '').lower()
+        directives = [d.strip() for d in cache_control.split(',') if d.strip()]
+        
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return max(0, int(directive.split('=', 1)[1].strip('"')))
+                except ValueError:
+                    return 0
+        
+        expires = response_headers.get('Expires')
+        if expires:
+            try:
+                return max(0, int(parsedate_to_datetime(expires).timestamp() - time.time()))
+            except (TypeError, ValueError):
+                return 0
+        
+        return self.cache_default_ttl
+    
+    def _cache_lookup(self, cache_key: tuple) -> Optional[tuple]:
+        """Get a cache entry (fresh or stale) and mark it as recently used."""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached:
+                self._cache.move_to_end(cache_key)
+            return cached
+    
+    def _cache_store(self, cache_key: tuple, result: str, response_headers) -> None:
+        """Store a response in the LRU cache, evicting the oldest entries past the limit."""
+        ttl = self._cache_ttl(response_headers)
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        
+        with self._cache_lock:
+            # no-store, or nothing to serve fresh and nothing to revalidate with
+            if ttl is None or (ttl == 0 and not (etag or last_modified)):
+                self._cache.pop(cache_key, None)
+                return
+            
+            self._cache[cache_key] = (time.monotonic() + ttl, result, etag, last_modified)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+    
+    def _disk_key(self, cache_key: tuple) -> str:
+        """Hash a cache key into a stable on-disk key (frozenset order varies between runs)."""
+        method, url, headers, data, max_content_length = cache_key
+        parts = [method, url, repr(sorted(headers or ())), repr(data), str(max_content_length)]
+        return hashlib.blake2b("\n".join(parts).encode('utf-8'), digest_size=20).hexdigest()
+    
+    def _has_credentials(self, cache_key: tuple) -> bool:
+        """Check whether a cached request carried credentials (never persisted to disk)."""
+        request_headers = cache_key[2] or ()
+        return any(name.lower() in _CREDENTIAL_HEADERS for name, _ in request_headers)
+    
+    def _disk_lookup(self, cache_key: tuple) -> Optional[str]:
+        """Get a fresh response persisted by an earlier run, promoting it to the memory cache."""
+        disk = _disk_cache()
+        if disk is None or self._has_credentials(cache_key):
+            return None
+        try:
+            entry, expire_time = disk.get(self._disk_key(cache_key), expire_time=True)
+        except Exception:
+            return None
+        if not entry or not expire_time:
+            return None
+        
+        result, etag, last_modified = entry
+        remaining = expire_time - time.time()
+        if remaining <= 0:
+            return None
+        with self._cache_lock:
+            self._cache[cache_key] = (time.monotonic() + remaining, result, etag, last_modified)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+        return result
+    
+    def _disk_store(self, cache_key: tuple, result: str, response_headers) -> None:
+        """Persist a fresh response to disk, skipping anything user-specific or marked no-store."""
+        disk = _disk_cache()
+        if disk is None or self._has_credentials(cache_key) or response_headers.get('Set-Cookie'):
+            return
+        cache_control = (response_headers.get('Cache-Control') or '').lower()
+        if 'private' in [d.strip() for d in cache_control.split(',')]:
+            return
+        ttl = self._cache_ttl(response_headers)
+        if not ttl:
+            return
+        try:
+            disk.set(self._disk_key(cache_key),
+                     (result, response_headers.get('ETag'), response_headers.get('Last-Modified')),
+                     expire=ttl)
+        except Exception:
+            # A full disk or locked database should never fail the request itself
+            pass
+    
     def _is_safe_url(self, url: str) -> bool:
         """Check if URL is safe to access with common sense protection."""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             
             # Block file:// and other dangerous schemes
-            if parsed.scheme not in ['http', 'https']:
+            if parsed.scheme not in ('http', 'https'):
                 return False
             
             # Block localhost/loopback - common sense protection
             hostname = parsed.hostname
-            if hostname and hostname.lower() in ['localhost', '127.0.0.1', '0.0.0.0', '::1']:
+            if not hostname:
+                return True
+            hostname = hostname.lower()
+            if hostname in _BLOCKED_HOSTS:
                 return False
             
+            # Block private, loopback and link-local addresses (SSRF protection)
+            try:
+                ip = ipaddress.ip_address(hostname)
+            except ValueError:
+                # inet_aton reads the shorthand and integer forms the resolver accepts too,
+                # e.g. "127.1", "2130706433" and "0x7f000001"
+                try:
+                    ip = ipaddress.IPv4Address(socket.inet_aton(hostname))
+                except OSError:
+                    ip = None
+            if ip is not None:
+                return not _is_internal_address(ip)
+            
+            # A name is only as safe as every address it resolves to
+            try:
+                addresses = socket.getaddrinfo(hostname, parsed.port, proto=socket.IPPROTO_TCP)
+            except socket.gaierror:
+                # Unresolvable here (or only via a proxy); the request itself will fail or go through the proxy
+                return True
+            for *_, sockaddr in addresses:
+                if _is_internal_address(ipaddress.ip_address(sockaddr[0].split('%', 1)[0])):
+                    return False
+            
             return True
             
         except Exception:
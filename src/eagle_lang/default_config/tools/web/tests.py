@@ -0,0 +1,326 @@
+"""Tests for web tool."""
+
+import asyncio
+import socket
+import tempfile
+import time
+import unittest
+import urllib.error
+import urllib.request
+from email.message import Message
+from unittest.mock import patch, MagicMock
+from . import WebTool, _looks_like_json, _disk_cache, DISKCACHE_AVAILABLE
+
+WEB_MODULE = WebTool.__module__
+
+
+def _headers(**values) -> Message:
+    """Build an HTTP headers object like the one urllib returns."""
+    headers = Message()
+    for key, value in values.items():
+        headers[key.replace('_', '-')] = value
+    return headers
+
+
+def _response(body: bytes = b"hello", status: int = 200, **header_values) -> MagicMock:
+    """Build a mock urlopen response."""
+    response = MagicMock()
+    response.status = status
+    response.reason = "OK"
+    response.url = "https://example.com/"
+    response.headers = _headers(**header_values)
+    response.read.side_effect = [body, b""]
+    response.__enter__.return_value = response
+    return response
+
+
+# Names the fake resolver maps into the local network; anything else resolves publicly
+_INTERNAL_NAMES = {"intranet.example.com": "10.0.0.7", "rebound.example.com": "::1"}
+
+
+def _getaddrinfo(host, port, *args, **kwargs):
+    """Resolve names without touching the network."""
+    address = _INTERNAL_NAMES.get(host, "93.184.216.34")
+    family = socket.AF_INET6 if ":" in address else socket.AF_INET
+    return [(family, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", (address, port or 0))]
+
+
+class TestWebTool(unittest.TestCase):
+    """Test cases for the web tool."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tool = WebTool()
+        # Keep tests off the user's persistent ~/.eagle cache
+        disk_patch = patch(f'{WEB_MODULE}._disk_cache', return_value=None)
+        disk_patch.start()
+        self.addCleanup(disk_patch.stop)
+        dns_patch = patch(f'{WEB_MODULE}.socket.getaddrinfo', side_effect=_getaddrinfo)
+        dns_patch.start()
+        self.addCleanup(dns_patch.stop)
+
+    def test_tool_properties(self):
+        """Test that tool has required properties."""
+        self.assertEqual(self.tool.name, "web")
+        self.assertIsNotNone(self.tool.description)
+        self.assertIn("url", self.tool.parameters["required"])
+
+    def test_sandboxing(self):
+        """Test that sandboxing blocks non-http schemes and loopback hosts."""
+        self.assertIn("Invalid URL", self.tool.execute(url="file:///etc/passwd"))
+        self.assertIn("Access denied", self.tool.execute(url="http://localhost/"))
+
+    def test_private_addresses_blocked(self):
+        """Test that private, link-local and metadata addresses are blocked."""
+        for url in ["http://10.0.0.5/", "http://192.168.1.1/admin", "http://169.254.169.254/latest",
+                    "http://[::ffff:127.0.0.1]/", "http://metadata.google.internal/", "http://127.1.2.3/",
+                    # Shorthand and integer IPv4 forms the resolver also accepts
+                    "http://127.1/", "http://2130706433/", "http://0x7f000001/", "http://10.1/", "http://0/",
+                    # Names that resolve into the local network
+                    "http://intranet.example.com/", "http://rebound.example.com:8080/"]:
+            self.assertFalse(self.tool._is_safe_url(url), url)
+        self.assertTrue(self.tool._is_safe_url("https://example.com/"))
+        self.assertTrue(self.tool._is_safe_url("https://93.184.216.34/"))
+
+    def test_looks_like_json(self):
+        """Test JSON bodies are detected from their leading character."""
+        self.assertTrue(_looks_like_json('{"a": 1}'))
+        self.assertTrue(_looks_like_json('  \n[1, 2]'))
+        self.assertFalse(_looks_like_json('a=1&b=2'))
+        self.assertFalse(_looks_like_json('   '))
+
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_post_content_type_detection(self, mock_urlopen):
+        """Test POST bodies get a JSON or form Content-Type."""
+        mock_urlopen.side_effect = lambda *args, **kwargs: _response()
+
+        self.tool.execute(url="https://example.com/", method="POST", data='{"a": 1}', raw=True)
+        self.tool.execute(url="https://example.com/", method="POST", data="a=1", raw=True)
+
+        content_types = [call.args[0].get_header('Content-type') for call in mock_urlopen.call_args_list]
+        self.assertEqual(content_types, ['application/json', 'application/x-www-form-urlencoded'])
+
+    def test_cache_ttl_from_headers(self):
+        """Test freshness lifetime is derived from Cache-Control."""
+        self.assertEqual(self.tool._cache_ttl(_headers(Cache_Control="public, max-age=120")), 120)
+        self.assertEqual(self.tool._cache_ttl(_headers(Cache_Control="no-cache")), 0)
+        self.assertIsNone(self.tool._cache_ttl(_headers(Cache_Control="no-store")))
+        self.assertEqual(self.tool._cache_ttl(_headers()), 0)
+    
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_no_freshness_info_not_served_from_cache(self, mock_urlopen):
+        """Test responses without Cache-Control/Expires are fetched again, revalidating if possible."""
+        mock_urlopen.side_effect = lambda *args, **kwargs: _response(ETag='"v1"')
+
+        self.tool.execute(url="https://example.com/status", raw=True)
+        self.tool.execute(url="https://example.com/status", raw=True)
+
+        self.assertEqual(mock_urlopen.call_count, 2)
+        self.assertEqual(mock_urlopen.call_args.args[0].get_header('If-none-match'), '"v1"')
+
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_get_served_from_cache(self, mock_urlopen):
+        """Test repeated GET requests reuse the cached response."""
+        mock_urlopen.side_effect = lambda *args, **kwargs: _response(Cache_Control="max-age=300")
+
+        first = self.tool.execute(url="https://example.com/", raw=True)
+        second = self.tool.execute(url="https://example.com/", raw=True)
+
+        self.assertEqual(first, second)
+        self.assertEqual(mock_urlopen.call_count, 1)
+
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_post_not_cached(self, mock_urlopen):
+        """Test non-GET requests always hit the network."""
+        mock_urlopen.side_effect = lambda *args, **kwargs: _response(Cache_Control="max-age=300")
+
+        self.tool.execute(url="https://example.com/", method="POST", data="a=1", raw=True)
+        self.tool.execute(url="https://example.com/", method="POST", data="a=1", raw=True)
+
+        self.assertEqual(mock_urlopen.call_count, 2)
+
+    def test_pooled_request(self):
+        """Test requests go through the shared connection pool when available."""
+        pooled = _response(Cache_Control="no-store")
+        mock_pool = MagicMock()
+        mock_pool.request.return_value = pooled
+
+        with patch(f'{WEB_MODULE}._POOL', mock_pool):
+            result = self.tool.execute(url="https://example.com/", raw=True)
+
+        self.assertIn("HTTP 200 OK", result)
+        self.assertIn("hello", result)
+        self.assertFalse(mock_pool.request.call_args.kwargs["preload_content"])
+
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_proxy_settings_bypass_pool(self, mock_urlopen):
+        """Test proxied URLs use the urllib opener (which honours proxies) and NO_PROXY hosts use the pool."""
+        mock_urlopen.side_effect = lambda *args, **kwargs: _response(Cache_Control="no-store")
+        mock_pool = MagicMock()
+        mock_pool.request.side_effect = lambda *args, **kwargs: _response(Cache_Control="no-store")
+        proxy_env = {"https_proxy": "http://proxy.example:3128", "no_proxy": "direct.example.com"}
+
+        with patch(f'{WEB_MODULE}._POOL', mock_pool), patch.dict('os.environ', proxy_env, clear=True):
+            self.tool.execute(url="https://example.com/", raw=True)
+            self.tool.execute(url="https://direct.example.com/", raw=True)
+
+        self.assertEqual(mock_urlopen.call_args.args[0].full_url, "https://example.com/")
+        self.assertEqual(mock_pool.request.call_args.args[1], "https://direct.example.com/")
+
+    def test_redirect_to_private_address_blocked(self):
+        """Test every redirect hop is re-checked against the sandbox."""
+        redirect = _response(status=302, Location="http://169.254.169.254/latest/meta-data/")
+        mock_pool = MagicMock()
+        mock_pool.request.return_value = redirect
+
+        with patch(f'{WEB_MODULE}._POOL', mock_pool):
+            result = self.tool.execute(url="https://example.com/go", raw=True)
+
+        self.assertIn("Access denied: redirect blocked for security: http://169.254.169.254/latest/meta-data/", result)
+        self.assertEqual(mock_pool.request.call_count, 1)
+        self.assertFalse(mock_pool.request.call_args.kwargs["redirect"])
+
+    def test_redirect_followed_and_credentials_dropped_cross_host(self):
+        """Test safe redirects are followed, without credentials when the host changes."""
+        mock_pool = MagicMock()
+        mock_pool.request.side_effect = [
+            _response(status=302, Location="/moved"),
+            _response(status=303, Location="https://cdn.example.net/final"),
+            _response(b"landed", Cache_Control="no-store"),
+        ]
+
+        with patch(f'{WEB_MODULE}._POOL', mock_pool):
+            result = self.tool.execute(url="https://example.com/start", method="POST", data="a=1",
+                                       headers={"Authorization": "Bearer secret"}, raw=True)
+
+        self.assertIn("landed", result)
+        hops = [(call.args[0], call.args[1], call.kwargs["headers"]) for call in mock_pool.request.call_args_list]
+        self.assertEqual([(method, url) for method, url, _ in hops], [
+            ("POST", "https://example.com/start"),
+            ("GET", "https://example.com/moved"),
+            ("GET", "https://cdn.example.net/final"),
+        ])
+        self.assertIn("Authorization", hops[1][2])
+        self.assertNotIn("Authorization", hops[2][2])
+
+    def test_redirect_limit_matches_urllib(self):
+        """Test as many redirect hops are followed as urlopen would, and no more."""
+        limit = urllib.request.HTTPRedirectHandler.max_redirections
+        mock_pool = MagicMock()
+        mock_pool.request.side_effect = lambda *args, **kwargs: _response(status=302, Location="/again")
+
+        with patch(f'{WEB_MODULE}._POOL', mock_pool):
+            result = self.tool.execute(url="https://example.com/start", raw=True)
+
+        self.assertIn(f"too many redirects (more than {limit})", result)
+        self.assertEqual(mock_pool.request.call_count, limit + 1)
+
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_urllib_redirect_to_loopback_blocked(self, mock_open):
+        """Test the urllib fallback also checks redirect targets."""
+        mock_open.side_effect = urllib.error.HTTPError(
+            "https://example.com/", 301, "Moved", _headers(Location="http://127.0.0.1:8080/"), None)
+
+        result = self.tool.execute(url="https://example.com/", raw=True)
+
+        self.assertIn("Access denied: redirect blocked for security", result)
+
+    @patch(f'{WEB_MODULE}._POOL')
+    def test_pooled_error_status(self, mock_pool):
+        """Test pooled error statuses map to the existing HTTP error message."""
+        mock_pool.request.return_value = _response(status=404)
+        mock_pool.request.return_value.reason = "Not Found"
+
+        result = self.tool.execute(url="https://example.com/missing", raw=True)
+
+        self.assertIn("HTTP Error 404: Not Found", result)
+
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_large_body_truncated_and_closed_early(self, mock_urlopen):
+        """Test oversized bodies are read only up to the limit."""
+        response = _response()
+        response.read.side_effect = lambda amt: b"x" * amt
+        mock_urlopen.return_value = response
+
+        result = self.tool.execute(url="https://example.com/big", max_content_length=100000, raw=True)
+
+        self.assertIn("(Content truncated to 100000 bytes)", result)
+        self.assertLessEqual(sum(call.args[0] for call in response.read.call_args_list), 100001)
+        response.close.assert_called()
+
+    def test_execute_many_runs_concurrently(self):
+        """Test batched requests overlap and keep their order."""
+        def slow_request(url, *args):
+            time.sleep(0.2)
+            return f"fetched {url}"
+
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        with patch.object(self.tool, '_make_request', side_effect=slow_request):
+            start = time.monotonic()
+            results = asyncio.run(self.tool.execute_many([{"url": url, "raw": True} for url in urls]))
+            elapsed = time.monotonic() - start
+
+        self.assertEqual(results, [f"fetched {url}" for url in urls])
+        self.assertLess(elapsed, 0.2 * len(urls))
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays within its entry limit."""
+        self.tool.cache_max_entries = 2
+        for i in range(3):
+            self.tool._cache_store(("GET", str(i)), f"result {i}", _headers(Cache_Control="max-age=60"))
+
+        self.assertEqual(list(self.tool._cache), [("GET", "1"), ("GET", "2")])
+
+    @unittest.skipUnless(DISKCACHE_AVAILABLE, "diskcache not installed")
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_disk_cache_persists_across_instances(self, mock_urlopen):
+        """Test fresh responses are reused by a new tool instance, except cookie-setting ones."""
+        import diskcache
+        
+        with tempfile.TemporaryDirectory() as tmp, diskcache.Cache(tmp) as disk, \
+                patch(f'{WEB_MODULE}._disk_cache', return_value=disk):
+            mock_urlopen.side_effect = lambda *args, **kwargs: _response(Cache_Control="max-age=300")
+            first = WebTool().execute(url="https://example.com/", raw=True)
+            second = WebTool().execute(url="https://example.com/", raw=True)
+            
+            mock_urlopen.side_effect = lambda *args, **kwargs: _response(
+                Cache_Control="max-age=300", Set_Cookie="session=1")
+            WebTool().execute(url="https://example.com/login", raw=True)
+            WebTool().execute(url="https://example.com/login", raw=True)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(mock_urlopen.call_count, 3)
+
+    @unittest.skipUnless(DISKCACHE_AVAILABLE, "diskcache not installed")
+    @patch(f'{WEB_MODULE}._POOL', None)
+    @patch(f'{WEB_MODULE}._OPENER.open')
+    def test_disk_cache_skips_private_and_credentialed(self, mock_open):
+        """Test authenticated requests and private responses never reach the disk cache."""
+        import diskcache
+        
+        with tempfile.TemporaryDirectory() as tmp, diskcache.Cache(tmp) as disk, \
+                patch(f'{WEB_MODULE}._disk_cache', return_value=disk):
+            mock_open.side_effect = lambda *args, **kwargs: _response(Cache_Control="max-age=300")
+            WebTool().execute(url="https://example.com/me", headers={"authorization": "Bearer x"}, raw=True)
+            WebTool().execute(url="https://example.com/me", headers={"Cookie": "session=1"}, raw=True)
+            
+            mock_open.side_effect = lambda *args, **kwargs: _response(Cache_Control="private, max-age=300")
+            WebTool().execute(url="https://example.com/account", raw=True)
+            
+            self.assertEqual(len(disk), 0)
+
+    def test_disk_cache_opt_out(self):
+        """Test the disk cache can be switched off from the environment."""
+        with patch.dict('os.environ', {"EAGLE_WEB_DISK_CACHE": "off"}):
+            self.assertIsNone(_disk_cache())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,64 +1,141 @@
 """Eagle initialization and setup functionality."""
 
+import functools
 import os
+import re
+import sys
 import shutil
 import json
 import time
-from .config import get_default_config, save_config
-from .interpreter import EagleInterpreter
-from .providers import PROVIDERS, get_provider_models, get_provider_api_key_env
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from .config import CONFIG_FILENAME, get_default_config, save_config
+from .providers import PROVIDERS, build_provider_map, get_provider_models, get_provider_api_key_env
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-def eagle_init(global_install: bool = False):
+# Environment variable naming a TOML file that answers every eagle init prompt
+INIT_CONFIG_ENV = "EAGLE_INIT_CONFIG"
+
+
+# eagle_init output is collected here and written in one go before each prompt
+_output_buffer: List[str] = []
+
+
+def _print(message: str = "") -> None:
+    """Queue a line of setup output."""
+    _output_buffer.append(message)
+
+
+def _flush_output() -> None:
+    """Write all queued setup output with a single write."""
+    if _output_buffer:
+        sys.stdout.write("\n".join(_output_buffer) + "\n")
+        _output_buffer.clear()
+    sys.stdout.flush()
+
+
+def _input(prompt: str) -> str:
+    """Flush queued output so it appears before the prompt, then ask."""
+    _flush_output()
+    return input(prompt)
+
+
+def _flushes_output(func):
+    """Make sure queued setup output is written however the function returns."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush_output()
+    return wrapper
+
+
+def _dir_entries(path: str) -> set:
+    """Get the names in a directory with a single scan, or an empty set if it is missing."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _is_installed(eagle_dir: str) -> bool:
     """
-    Interactive setup for Eagle config including provider, model, and API key configuration.
+    Check if a .eagle folder holds an Eagle install.
     
-    Args:
-        global_install: If True, install config in user home directory. If False, install in current directory.
+    The folder alone is not enough: the web tool keeps its disk cache in ~/.eagle/cache.
     """
-    print("\n🦅 Welcome to Eagle Setup! 🦅")
-    
-    # Check for existing .eagle directory
-    project_eagle_dir = os.path.join(os.getcwd(), ".eagle")
-    user_eagle_dir = os.path.expanduser("~/.eagle")
-    
-    existing_config = None
-    if not global_install and os.path.exists(project_eagle_dir):
-        print(f"📁 Found existing .eagle directory: {project_eagle_dir}")
-        action = input("What would you like to do? (fresh/cancel): ").strip().lower()
-        if action == "cancel":
-            print("Setup cancelled.")
-            return
-        elif action == "fresh":
-            import shutil
-            backup_dir = f"{project_eagle_dir}_backup_{int(time.time())}"
-            shutil.move(project_eagle_dir, backup_dir)
-            print(f"📦 Backed up existing config to: {backup_dir}")
-            print("🆕 Starting fresh installation")
-        else:
-            print("Invalid option. Use 'eagle update-tools' to update tools only.")
-            return
-    elif global_install and os.path.exists(user_eagle_dir):
-        print(f"📁 Found existing global .eagle directory: {user_eagle_dir}")
-        action = input("What would you like to do? (fresh/cancel): ").strip().lower()
-        if action == "cancel":
-            print("Setup cancelled.")
-            return
-        elif action == "fresh":
-            import shutil
-            backup_dir = f"{user_eagle_dir}_backup_{int(time.time())}"
-            shutil.move(user_eagle_dir, backup_dir)
-            print(f"📦 Backed up existing config to: {backup_dir}")
-            print("🆕 Starting fresh installation")
-        else:
-            print("Invalid option. Use 'eagle update-tools' to update tools only.")
-            return
-    
-    print("Let's configure your AI assistant...\n")
-    
-    # Load default config for fallback values
-    fallback_config = get_default_config()
-    
+    entries = _dir_entries(eagle_dir)
+    return CONFIG_FILENAME in entries or "tools" in entries
+
+
+def _copy_default_rules(default_rules_path: str, target_rules_path: str,
+                        default_exists: bool, target_exists: bool) -> List[str]:
+    """Copy the default rules file unless one is already installed."""
+    if target_exists:
+        return [f"📋 Rules file already exists: {target_rules_path}"]
+    if not default_exists:
+        return []
+    try:
+        shutil.copy2(default_rules_path, target_rules_path)
+        return [f"📋 Copied default rules to: {target_rules_path}"]
+    except Exception as e:
+        return [f"⚠️  Could not copy rules file: {e}"]
+
+
+def _copy_default_tools(default_tools_dir: str, target_tools_dir: str,
+                        default_exists: bool, target_exists: bool) -> List[str]:
+    """Install the default tools directory unless one is already installed."""
+    if target_exists:
+        return [f"🔧 Tools directory already exists: {target_tools_dir}"]
+    if not default_exists:
+        return []
+    try:
+        shutil.copytree(default_tools_dir, target_tools_dir)
+        return [f"🔧 Copied default tools to: {target_tools_dir}"]
+    except Exception as e:
+        return [f"⚠️  Could not copy tools directory: {e}"]
+
+
+def _write_env_key(target_env_path: str, env_exists: bool, api_key_env: str,
+                   api_key_for_env: Optional[str]) -> List[str]:
+    """Create or update the .env file in the .eagle folder with the entered API key."""
+    if not api_key_for_env:
+        return []
+    
+    env_content = ""
+    if env_exists:
+        with open(target_env_path, "r") as f:
+            env_content = f.read()
+    
+    # Update existing key in place (a function replacement keeps backslashes in the key literal)
+    key_pattern = re.compile(rf"^{re.escape(api_key_env)}=.*$", re.MULTILINE)
+    env_content, replaced = key_pattern.subn(lambda _: f"{api_key_env}={api_key_for_env}",
+                                             env_content, count=1)
+    if not replaced:
+        # Add new key
+        if env_content and not env_content.endswith('\n'):
+            env_content += '\n'
+        env_content += f"{api_key_env}={api_key_for_env}\n"
+    
+    with open(target_env_path, "w") as f:
+        f.write(env_content)
+    return [f"✅ API key saved to {target_env_path}"]
+
+
+def _default_agent_config() -> Dict[str, Any]:
+    """Get the packaged default agent, whose settings seed every init answer."""
+    return get_default_config()["agents"][0]
+
+
+def _prompt_init_settings(fallback_config: Dict[str, Any], existing_config: Optional[Dict[str, Any]],
+                          global_install: bool) -> Tuple[str, str, list, list, Optional[str], bool]:
+    """Walk through the interactive setup steps and return the chosen settings."""
     # Use existing config as defaults if available
     current_provider = existing_config.get("provider") if existing_config else fallback_config["provider"]
     current_model = existing_config.get("model") if existing_config else fallback_config["model"]
@@ -66,58 +143,48 @@ def eagle_init(global_install: bool = False):
     current_tools = existing_config.get("tools") if existing_config else fallback_config["tools"]
     
     # Step 1: Choose Provider
-    print("Step 1: Choose your AI provider")
-    print("Available providers:")
+    _print("Step 1: Choose your AI provider")
+    _print("Available providers:")
     for i, (provider_id, provider_config) in enumerate(PROVIDERS.items(), 1):
         models_preview = ", ".join(provider_config["models"][:3])
         if len(provider_config["models"]) > 3:
             models_preview += "..."
         current_marker = " (current)" if provider_id == current_provider else ""
-        print(f"  {i}. {provider_config['name']} ({models_preview}){current_marker}")
+        _print(f"  {i}. {provider_config['name']} ({models_preview}){current_marker}")
     
-    provider_input = input(f"\nEnter your choice (1-{len(PROVIDERS)}) or provider name (current: {current_provider}): ").strip()
+    provider_input = _input(f"\nEnter your choice (1-{len(PROVIDERS)}) or provider name (current: {current_provider}): ").strip()
     
     # Use current provider if input is empty
     if not provider_input:
         default_provider = current_provider
     else:
-        # Build provider map dynamically
-        provider_map = {}
-        for i, provider_id in enumerate(PROVIDERS.keys(), 1):
-            provider_map[str(i)] = provider_id
-            provider_map[provider_id] = provider_id
-            # Add alternative names
-            if provider_id == "claude":
-                provider_map["anthropic"] = provider_id
-            elif provider_id == "gemini":
-                provider_map["google"] = provider_id
-        
-        default_provider = provider_map.get(provider_input.lower(), current_provider)
+        default_provider = build_provider_map().get(provider_input.lower(), current_provider)
     
-    print(f"Selected provider: {default_provider}")
+    _print(f"Selected provider: {default_provider}")
     
     # Step 2: Configure API Key
-    print(f"\nStep 2: Configure API key for {default_provider}")
+    _print(f"\nStep 2: Configure API key for {default_provider}")
     api_key_env = get_provider_api_key_env(default_provider)
     
+    api_key_for_env = None
     current_key = os.getenv(api_key_env)
     if current_key:
-        print(f"✅ {api_key_env} is already set")
-        update_key = input("Do you want to update it? (y/N): ").strip().lower()
+        _print(f"✅ {api_key_env} is already set")
+        update_key = _input("Do you want to update it? (y/N): ").strip().lower()
         if update_key not in ['y', 'yes']:
-            print("Keeping existing API key")
+            _print("Keeping existing API key")
         else:
             current_key = None
     
     if not current_key:
-        print(f"Please set your {api_key_env}")
-        print("You can:")
-        print(f"  1. Set environment variable: export {api_key_env}='your-key'")
-        print(f"  2. Add to .env file: {api_key_env}=your-key")
+        _print(f"Please set your {api_key_env}")
+        _print("You can:")
+        _print(f"  1. Set environment variable: export {api_key_env}='your-key'")
+        _print(f"  2. Add to .env file: {api_key_env}=your-key")
         
-        set_now = input("Do you want to set it now? (y/N): ").strip().lower()
+        set_now = _input("Do you want to set it now? (y/N): ").strip().lower()
         if set_now in ['y', 'yes']:
-            api_key = input(f"Enter your {default_provider} API key: ").strip()
+            api_key = _input(f"Enter your {default_provider} API key: ").strip()
             if api_key:
                 # Store API key for later use in .eagle folder
                 api_key_for_env = api_key
@@ -125,17 +192,17 @@ def eagle_init(global_install: bool = False):
                 # Set for current session
                 os.environ[api_key_env] = api_key
             else:
-                print("⚠️  No API key entered. You'll need to set it manually later.")
+                _print("⚠️  No API key entered. You'll need to set it manually later.")
     
     # Step 3: Choose Model
-    print(f"\nStep 3: Choose model for {default_provider}")
+    _print(f"\nStep 3: Choose model for {default_provider}")
     available_models = get_provider_models(default_provider)
-    print("Available models:")
+    _print("Available models:")
     for i, model in enumerate(available_models, 1):
         current_marker = " (current)" if model == current_model else ""
-        print(f"  {i}. {model}{current_marker}")
+        _print(f"  {i}. {model}{current_marker}")
     
-    model_input = input(f"\nEnter choice (1-{len(available_models)}) or model name (current: {current_model}): ").strip()
+    model_input = _input(f"\nEnter choice (1-{len(available_models)}) or model name (current: {current_model}): ").strip()
     
     # Use current model if input is empty
     if not model_input:
@@ -157,36 +224,171 @@ def eagle_init(global_install: bool = False):
         except:
             default_model = available_models[0]
     
-    print(f"Selected model: {default_model}")
+    _print(f"Selected model: {default_model}")
     
     # Step 4: Additional Options
-    print(f"\nStep 4: Additional options")
+    _print(f"\nStep 4: Additional options")
     
     # Rules
-    rules_input = input("Rules files (comma-separated, or Enter for default): ").strip()
+    rules_input = _input("Rules files (comma-separated, or Enter for default): ").strip()
     if rules_input:
         rules_list = [r.strip() for r in rules_input.split(",") if r.strip()]
     else:
         rules_list = fallback_config["rules"]
     
     # Tools
-    tools_input = input("Tools to enable (comma-separated, or Enter for default): ").strip()
+    tools_input = _input("Tools to enable (comma-separated, or Enter for default): ").strip()
     if tools_input:
         tools_list = [t.strip() for t in tools_input.split(",") if t.strip()]
     else:
         tools_list = fallback_config["tools"]
     
     # Step 5: Save Configuration
-    print(f"\nStep 5: Save configuration")
+    _print(f"\nStep 5: Save configuration")
     
     # Determine where to save
     if global_install:
         to_project = False
-        print("Installing globally (to home directory)")
+        _print("Installing globally (to home directory)")
     else:
-        save_scope = input("Save config for this project only, or for all projects? (project/global): ").strip().lower()
+        save_scope = _input("Save config for this project only, or for all projects? (project/global): ").strip().lower()
         to_project = save_scope != "global"
     
+    return default_provider, default_model, rules_list, tools_list, api_key_for_env, to_project
+
+
+def _load_init_settings(path: str) -> Optional[Dict[str, Any]]:
+    """Load scripted init answers from a TOML file, or None (after reporting why) if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        _print(f"❌ Init config not found: {path}")
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        _print(f"❌ Could not read init config {path}: {e}")
+    return None
+
+
+def _as_list(value) -> list:
+    """Accept either a TOML array or a comma-separated string."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return list(value)
+
+
+def _resolve_init_settings(init_settings: Dict[str, Any], fallback_config: Dict[str, Any],
+                           global_install: bool) -> Optional[Tuple[str, str, list, list, Optional[str], bool]]:
+    """Turn scripted init answers into the same settings the interactive steps produce."""
+    # Fall back lazily: only settings missing from the file need a default
+    provider_input = str(init_settings["provider"] if "provider" in init_settings else fallback_config["provider"])
+    default_provider = build_provider_map().get(provider_input.lower())
+    if default_provider is None:
+        _print(f"❌ Unknown provider in init config: {provider_input}")
+        return None
+    
+    available_models = get_provider_models(default_provider)
+    if "model" in init_settings:
+        default_model = init_settings["model"]
+    elif default_provider == fallback_config["provider"]:
+        default_model = fallback_config["model"]
+    else:
+        default_model = available_models[0]
+    if default_model not in available_models:
+        _print(f"❌ Unknown model for {default_provider} in init config: {default_model}")
+        return None
+    
+    rules_list = _as_list(init_settings["rules"] if "rules" in init_settings else fallback_config["rules"])
+    tools_list = init_settings["tools"] if "tools" in init_settings else fallback_config["tools"]
+    if isinstance(tools_list, str):
+        tools_list = _as_list(tools_list)
+    
+    api_key_for_env = init_settings.get("api_key") or None
+    if api_key_for_env:
+        # Set for current session
+        os.environ[get_provider_api_key_env(default_provider)] = api_key_for_env
+    
+    to_project = False if global_install else init_settings.get("scope", "project") != "global"
+    
+    _print(f"Selected provider: {default_provider}")
+    _print(f"Selected model: {default_model}")
+    return default_provider, default_model, rules_list, tools_list, api_key_for_env, to_project
+
+
+@_flushes_output
+def eagle_init(global_install: bool = False, config_path: str = None):
+    """
+    Interactive setup for Eagle config including provider, model, and API key configuration.
+    
+    Args:
+        global_install: If True, install config in user home directory. If False, install in current directory.
+        config_path: Optional TOML file answering every prompt (provider, model, rules, tools,
+            api_key, scope, on_existing) for non-interactive setup. Defaults to $EAGLE_INIT_CONFIG.
+    """
+    _print("\n🦅 Welcome to Eagle Setup! 🦅")
+    
+    # Scripted setup: answers come from a TOML file instead of prompts
+    config_path = config_path or os.environ.get(INIT_CONFIG_ENV)
+    init_settings = None
+    if config_path:
+        init_settings = _load_init_settings(config_path)
+        if init_settings is None:
+            return
+        _print(f"📄 Using init config: {config_path}")
+    
+    # Check for existing .eagle directory
+    project_eagle_dir = os.path.join(os.getcwd(), ".eagle")
+    user_eagle_dir = os.path.expanduser("~/.eagle")
+    
+    existing_config = None
+    if not global_install and _is_installed(project_eagle_dir):
+        _print(f"📁 Found existing .eagle directory: {project_eagle_dir}")
+        if init_settings is not None:
+            action = str(init_settings.get("on_existing", "cancel")).lower()
+        else:
+            action = _input("What would you like to do? (fresh/cancel): ").strip().lower()
+        if action == "cancel":
+            _print("Setup cancelled.")
+            return
+        elif action == "fresh":
+            backup_dir = f"{project_eagle_dir}_backup_{int(time.time())}"
+            shutil.move(project_eagle_dir, backup_dir)
+            _print(f"📦 Backed up existing config to: {backup_dir}")
+            _print("🆕 Starting fresh installation")
+        else:
+            _print("Invalid option. Use 'eagle update-tools' to update tools only.")
+            return
+    elif global_install and _is_installed(user_eagle_dir):
+        _print(f"📁 Found existing global .eagle directory: {user_eagle_dir}")
+        if init_settings is not None:
+            action = str(init_settings.get("on_existing", "cancel")).lower()
+        else:
+            action = _input("What would you like to do? (fresh/cancel): ").strip().lower()
+        if action == "cancel":
+            _print("Setup cancelled.")
+            return
+        elif action == "fresh":
+            backup_dir = f"{user_eagle_dir}_backup_{int(time.time())}"
+            shutil.move(user_eagle_dir, backup_dir)
+            _print(f"📦 Backed up existing config to: {backup_dir}")
+            _print("🆕 Starting fresh installation")
+        else:
+            _print("Invalid option. Use 'eagle update-tools' to update tools only.")
+            return
+    
+    _print("Let's configure your AI assistant...\n")
+    
+    # Load default agent settings for fallback values
+    fallback_config = _default_agent_config()
+    
+    if init_settings is not None:
+        resolved = _resolve_init_settings(init_settings, fallback_config, global_install)
+        if resolved is None:
+            return
+    else:
+        resolved = _prompt_init_settings(fallback_config, existing_config, global_install)
+    default_provider, default_model, rules_list, tools_list, api_key_for_env, to_project = resolved
+    api_key_env = get_provider_api_key_env(default_provider)
+    
     # Create config in new multi-agent format
     config = {
         "verbose": True,
@@ -202,7 +404,8 @@ def eagle_init(global_install: bool = False):
         ]
     }
     
-    # Save config file
+    # Save config file (save_config prints directly, so flush ours first to keep the order)
+    _flush_output()
     save_config(config, to_project=to_project)
     
     # Copy default files to .eagle folder
@@ -223,59 +426,33 @@ def eagle_init(global_install: bool = False):
     target_env_path = os.path.join(target_dir, ".env")
     target_tools_dir = os.path.join(target_dir, "tools")
     
-    # Copy rules file if it doesn't exist
-    if os.path.exists(default_rules_path) and not os.path.exists(target_rules_path):
-        try:
-            shutil.copy2(default_rules_path, target_rules_path)
-            print(f"📋 Copied default rules to: {target_rules_path}")
-        except Exception as e:
-            print(f"⚠️  Could not copy rules file: {e}")
-    elif os.path.exists(target_rules_path):
-        print(f"📋 Rules file already exists: {target_rules_path}")
-    
-    # Copy tools directory if it doesn't exist
-    if os.path.exists(default_tools_dir) and not os.path.exists(target_tools_dir):
-        try:
-            shutil.copytree(default_tools_dir, target_tools_dir)
-            print(f"🔧 Copied default tools to: {target_tools_dir}")
-        except Exception as e:
-            print(f"⚠️  Could not copy tools directory: {e}")
-    elif os.path.exists(target_tools_dir):
-        print(f"🔧 Tools directory already exists: {target_tools_dir}")
-    
-    # Create or update .env file in .eagle folder
-    if 'api_key_for_env' in locals() and api_key_for_env:
-        env_content = ""
-        if os.path.exists(target_env_path):
-            with open(target_env_path, "r") as f:
-                env_content = f.read()
-        
-        # Check if key already exists in .env
-        if f"{api_key_env}=" in env_content:
-            # Update existing key
-            lines = env_content.split('\n')
-            for i, line in enumerate(lines):
-                if line.startswith(f"{api_key_env}="):
-                    lines[i] = f"{api_key_env}={api_key_for_env}"
-                    break
-            env_content = '\n'.join(lines)
-        else:
-            # Add new key
-            if env_content and not env_content.endswith('\n'):
-                env_content += '\n'
-            env_content += f"{api_key_env}={api_key_for_env}\n"
-        
-        with open(target_env_path, "w") as f:
-            f.write(env_content)
-        print(f"✅ API key saved to {target_env_path}")
+    # One directory scan per side instead of a stat per path
+    default_entries = _dir_entries(default_config_dir)
+    target_entries = _dir_entries(target_dir)
+    
+    # The copy steps touch independent paths, so run their disk I/O concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        steps = [
+            executor.submit(_copy_default_rules, default_rules_path, target_rules_path,
+                            "eagle_rules.md" in default_entries, "eagle_rules.md" in target_entries),
+            executor.submit(_copy_default_tools, default_tools_dir, target_tools_dir,
+                            "tools" in default_entries, "tools" in target_entries),
+            executor.submit(_write_env_key, target_env_path, ".env" in target_entries,
+                            api_key_env, api_key_for_env),
+        ]
     
-    print("\n🎉 Eagle configuration complete!")
-    print(f"Provider: {default_provider}")
-    print(f"Model: {default_model}")
-    print(f"Rules: {', '.join(rules_list) if rules_list else 'None'}")
-    print(f"Tools: {', '.join(tools_list) if tools_list else 'None'}")
-    print(f"Config saved: {'Project' if to_project else 'Global'}")
-    print("\nYou can now run: eagle run your_file.caw\n")
+    # Report in a fixed order so output reads the same as a sequential setup
+    for step in steps:
+        for message in step.result():
+            _print(message)
+    
+    _print("\n🎉 Eagle configuration complete!")
+    _print(f"Provider: {default_provider}")
+    _print(f"Model: {default_model}")
+    _print(f"Rules: {', '.join(rules_list) if rules_list else 'None'}")
+    _print(f"Tools: {', '.join(tools_list) if tools_list else 'None'}")
+    _print(f"Config saved: {'Project' if to_project else 'Global'}")
+    _print("\nYou can now run: eagle run your_file.caw\n")
 
 
 def update_tools():
@@ -288,9 +465,9 @@ def update_tools():
     
     # Determine which directory to update
     target_dirs = []
-    if os.path.exists(project_eagle_dir):
+    if _is_installed(project_eagle_dir):
         target_dirs.append(("Project", project_eagle_dir))
-    if os.path.exists(user_eagle_dir):
+    if _is_installed(user_eagle_dir):
         target_dirs.append(("Global", user_eagle_dir))
     
     if not target_dirs:
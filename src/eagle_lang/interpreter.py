@@ -2,6 +2,7 @@
 
 import os
 import json
+import functools
 from typing import Dict, Any, Optional
 from openai import OpenAI
 import anthropic
@@ -12,10 +13,35 @@ from .tools.base import tool_registry
 from .providers import get_provider_config
 
 
+@functools.lru_cache(maxsize=8)
+def _create_client(provider: str, api_key: str, model_name: str = None, base_url: str = None):
+    """
+    Create a provider SDK client.
+    
+    Cached so interpreters created in the same process (sub-agents run by call_agent,
+    jobs in an `eagle serve` worker) share one client and its pooled connections.
+    """
+    if provider == "openai":
+        return OpenAI(api_key=api_key)
+    elif provider == "claude":
+        return anthropic.Anthropic(api_key=api_key)
+    elif provider == "gemini":
+        genai.configure(api_key=api_key)
+        return genai.GenerativeModel(model_name)
+    elif provider == "openrouter":
+        return OpenAI(api_key=api_key, base_url=base_url or "https://openrouter.ai/api/v1")
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+
+class AgentCancelled(Exception):
+    """Raised inside a run whose caller has stopped waiting for it."""
+
+
 class EagleInterpreter:
     """The core Eagle interpreter that handles AI provider interactions."""
     
-    def __init__(self, provider: str = None, model_name: str = None, rules: list = None, config: dict = None, verbose: bool = None, additional_context: list = None):
+    def __init__(self, provider: str = None, model_name: str = None, rules: list = None, config: dict = None, verbose: bool = None, additional_context: list = None, interactive: bool = True):
         self.default_config = get_default_config()
         self.config = config or self.default_config
         self.provider = provider or self.config.get("provider", self.default_config["provider"])
@@ -23,6 +49,11 @@ class EagleInterpreter:
         self.rules = rules or self.config.get("rules", self.default_config["rules"])
         self.verbose = verbose if verbose is not None else self.config.get("verbose", self.default_config.get("verbose", False))
         self.additional_context = additional_context or []
+        # Without a terminal (e.g. an `eagle serve` worker) nothing can be asked of the user
+        self.interactive = interactive
+        
+        # Set by whoever runs this interpreter (e.g. call_agent on timeout) to stop it at the next safe point
+        self.cancel_event = None
         
         # Initialize tools first
         self.tools_enabled = self.config.get("tools")
@@ -183,10 +214,12 @@ You have access to the following tools:
             all_configured_tools = allowed_tools + permission_tools
             
             # Return exactly what's configured (empty means no tools)
-            return [tool for tool in all_configured_tools if tool in tool_registry.list_tools()]
+            registered = tool_registry.names_set
+            return [tool for tool in all_configured_tools if tool in registered]
         elif isinstance(self.tools_enabled, list):
             # Legacy list format
-            return [tool for tool in self.tools_enabled if tool in tool_registry.list_tools()]
+            registered = tool_registry.names_set
+            return [tool for tool in self.tools_enabled if tool in registered]
         else:
             raise ValueError(f"Invalid tools configuration format. Expected dict or list, got {type(self.tools_enabled)}.")
     
@@ -206,18 +239,9 @@ You have access to the following tools:
             raise ValueError(f"{api_key_env} environment variable not set. Please set it or ensure your .env file is loaded.")
         
         try:
-            if self.provider == "openai":
-                return OpenAI(api_key=api_key)
-            elif self.provider == "claude":
-                return anthropic.Anthropic(api_key=api_key)
-            elif self.provider == "gemini":
-                genai.configure(api_key=api_key)
-                return genai.GenerativeModel(self.model_name)
-            elif self.provider == "openrouter":
-                base_url = provider_config.get("base_url", "https://openrouter.ai/api/v1")
-                return OpenAI(api_key=api_key, base_url=base_url)
-            else:
-                raise ValueError(f"Unsupported provider: {self.provider}")
+            # Gemini clients are bound to a model; the others serve any model
+            model_name = self.model_name if self.provider == "gemini" else None
+            return _create_client(self.provider, api_key, model_name, provider_config.get("base_url"))
         except Exception as e:
             if "authentication" in str(e).lower() or "api key" in str(e).lower():
                 print(f"Authentication error: Please check your {api_key_env} in the .env file or environment variables.")
@@ -268,8 +292,16 @@ You have access to the following tools:
             print("The .caw file is empty or contains only whitespace. No instructions for Eagle.")
             return
 
+        self.execute_instructions(caw_content)
+
+    def execute_instructions(self, instructions: str) -> None:
+        """Execute .caw-style instructions given as a string."""
+        if not instructions.strip():
+            print("No instructions for Eagle.")
+            return
+
         # Inject additional context and variables
-        enhanced_content = self._enhance_content_with_context(caw_content)
+        enhanced_content = self._enhance_content_with_context(instructions)
 
         if self.verbose:
             print("🧠 Processing your request...")
@@ -292,6 +324,7 @@ You have access to the following tools:
     
     def _get_llm_response(self, content: str, session_history: list = None) -> str:
         """Get response from the configured LLM provider."""
+        self._check_cancelled()
         max_tokens = self.config.get("max_tokens", self.default_config["max_tokens"])
         
         if self.verbose:
@@ -425,16 +458,19 @@ You have access to the following tools:
                 print(f"🔧 Executing tool: {tool_name}")
                 print(f"📋 Arguments: {tool_args}")
             
+            self._check_cancelled()
             tool = tool_registry.get(tool_name)
             if tool:
                 try:
                     # Check if tool requires permission
                     if self._tool_requires_permission(tool_name):
                         if not self._get_user_permission(tool_name, tool_args):
-                            result = f"Tool '{tool_name}' execution denied by user"
+                            result = self._permission_denied_message(tool_name)
                             if self.verbose:
                                 print(f"❌ Tool execution denied: {tool_name}")
                         else:
+                            # The answer may have come after this run was cancelled
+                            self._check_cancelled()
                             result = tool.execute(**tool_args)
                             if self.verbose:
                                 print(f"✅ Tool completed: {tool_name}")
@@ -442,6 +478,8 @@ You have access to the following tools:
                         result = tool.execute(**tool_args)
                         if self.verbose:
                             print(f"✅ Tool completed: {tool_name}")
+                except AgentCancelled:
+                    raise
                 except Exception as e:
                     result = f"Tool '{tool_name}' failed: {str(e)}"
                     if self.verbose:
@@ -459,6 +497,7 @@ You have access to the following tools:
             })
         
         # Continue conversation with tool results
+        self._check_cancelled()
         if self.verbose:
             print("🧠 Processing tool results...")
             
@@ -494,16 +533,19 @@ You have access to the following tools:
                 print(f"🔧 Executing tool: {tool_name}")
                 print(f"📋 Arguments: {tool_args}")
             
+            self._check_cancelled()
             tool = tool_registry.get(tool_name)
             if tool:
                 try:
                     # Check if tool requires permission
                     if self._tool_requires_permission(tool_name):
                         if not self._get_user_permission(tool_name, tool_args):
-                            result = f"Tool '{tool_name}' execution denied by user"
+                            result = self._permission_denied_message(tool_name)
                             if self.verbose:
                                 print(f"❌ Tool execution denied: {tool_name}")
                         else:
+                            # The answer may have come after this run was cancelled
+                            self._check_cancelled()
                             result = tool.execute(**tool_args)
                             if self.verbose:
                                 print(f"✅ Tool completed: {tool_name}")
@@ -511,6 +553,8 @@ You have access to the following tools:
                         result = tool.execute(**tool_args)
                         if self.verbose:
                             print(f"✅ Tool completed: {tool_name}")
+                except AgentCancelled:
+                    raise
                 except Exception as e:
                     result = f"Tool '{tool_name}' failed: {str(e)}"
                     if self.verbose:
@@ -534,6 +578,7 @@ You have access to the following tools:
         })
         
         # Continue conversation with tool results
+        self._check_cancelled()
         if self.verbose:
             print("🧠 Processing tool results...")
             
@@ -567,12 +612,21 @@ You have access to the following tools:
             return tool_name in require_permission
         return False
     
+    def _check_cancelled(self) -> None:
+        """Stop this run if its cancel event has been set."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise AgentCancelled("Agent run cancelled")
+    
     def _get_user_permission(self, tool_name: str, tool_args: dict) -> bool:
         """Get user permission for tool execution."""
         print(f"\n🔐 Permission Required")
         print(f"Tool: {tool_name}")
         print(f"Arguments: {tool_args}")
         
+        if not self.interactive:
+            print("Denied: no terminal to ask for permission in a non-interactive run")
+            return False
+        
         while True:
             response = input("Allow this tool execution? (y/n/details): ").strip().lower()
             if response in ['y', 'yes']:
@@ -588,6 +642,12 @@ You have access to the following tools:
             else:
                 print("Please enter 'y' (yes), 'n' (no), or 'd' (details)")
     
+    def _permission_denied_message(self, tool_name: str) -> str:
+        """Tool result reported to the model when permission was not granted."""
+        if not self.interactive:
+            return f"Tool '{tool_name}' execution denied: permission cannot be requested in a non-interactive run"
+        return f"Tool '{tool_name}' execution denied by user"
+    
     def generate_with_ai(self, prompt: str, max_tokens: int = None) -> str:
         """Generate content using the current AI session (for use by tools)."""
         if not max_tokens:
@@ -660,6 +720,8 @@ You have access to the following tools:
         print(f"\n⚠️  Keep your API key secure - never share it or commit it to version control!")
         
         # Offer to create/edit .env file
+        if not self.interactive:
+            return
         try:
             choice = input(f"\nWould you like Eagle to help create/edit {env_file}? (y/n): ").strip().lower()
             if choice in ['y', 'yes']:
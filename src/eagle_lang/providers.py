@@ -1,6 +1,8 @@
 """Hardcoded provider configurations for Eagle."""
 
-from typing import Dict, List, Any
+import functools
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 
 
 # Hardcoded provider configurations
@@ -39,6 +41,24 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Alternative names accepted wherever a provider id is typed in
+PROVIDER_ALIASES: Dict[str, str] = {
+    "anthropic": "claude",
+    "google": "gemini",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_provider_map() -> Mapping[str, str]:
+    """Map menu numbers (1-based), provider ids and aliases to provider ids."""
+    provider_map = {}
+    for i, provider_id in enumerate(PROVIDERS, 1):
+        provider_map[str(i)] = provider_id
+        provider_map[provider_id] = provider_id
+    provider_map.update(PROVIDER_ALIASES)
+    return MappingProxyType(provider_map)
+
+
 def get_provider_config(provider: str) -> Dict[str, Any]:
     """Get configuration for a specific provider."""
     if provider not in PROVIDERS:
@@ -51,11 +71,13 @@ def get_available_providers() -> List[str]:
     return list(PROVIDERS.keys())
 
 
+@functools.lru_cache(maxsize=None)
 def get_provider_models(provider: str) -> List[str]:
     """Get available models for a provider."""
     return get_provider_config(provider)["models"]
 
 
+@functools.lru_cache(maxsize=None)
 def get_provider_api_key_env(provider: str) -> str:
     """Get the environment variable name for a provider's API key."""
     return get_provider_config(provider)["api_key_env"]
@@ -0,0 +1,192 @@
+"""Run Eagle agents in-process and serve them to other processes over stdio."""
+
+import io
+import json
+import os
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Dict, Optional, TextIO
+
+from .tools.base import tool_registry
+
+# Each message is a 4-byte big-endian length followed by that many bytes of UTF-8 JSON
+_HEADER = struct.Struct(">I")
+
+
+def write_message(stream: BinaryIO, message: Dict[str, Any]) -> None:
+    """Write one length-prefixed JSON message and flush it."""
+    payload = json.dumps(message).encode("utf-8")
+    stream.write(_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict[str, Any]]:
+    """Read one length-prefixed JSON message, or None at end of stream."""
+    header = stream.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size:
+        raise EOFError("Truncated message header")
+    (length,) = _HEADER.unpack(header)
+    payload = stream.read(length)
+    if len(payload) < length:
+        raise EOFError("Truncated message body")
+    return json.loads(payload.decode("utf-8"))
+
+
+# Per-thread output targets for _ThreadRoutedStream
+_captures = threading.local()
+_install_lock = threading.Lock()
+
+
+class _ThreadRoutedStream:
+    """
+    Stand-in for sys.stdout/sys.stderr that sends writes to the current thread's capture target.
+
+    Threads without a capture write to the stream that was installed before it.
+    """
+
+    def __init__(self, name: str, default: TextIO):
+        self._name = name
+        self._default = default
+
+    def _target(self) -> TextIO:
+        return getattr(_captures, self._name, None) or self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._target(), attr)
+
+
+@contextmanager
+def _capture_output(stdout: TextIO, stderr: TextIO):
+    """
+    Send this thread's prints to the given streams, leaving other threads' output alone.
+
+    Unlike contextlib.redirect_stdout this never swaps sys.stdout back on exit, so a run
+    that outlives its caller cannot take over or restore streams under anyone else.
+    """
+    with _install_lock:
+        for name in ("stdout", "stderr"):
+            current = getattr(sys, name)
+            if not isinstance(current, _ThreadRoutedStream):
+                setattr(sys, name, _ThreadRoutedStream(name, current))
+
+    previous = getattr(_captures, "stdout", None), getattr(_captures, "stderr", None)
+    _captures.stdout, _captures.stderr = stdout, stderr
+    try:
+        yield
+    finally:
+        _captures.stdout, _captures.stderr = previous
+
+
+def run_instructions(instructions: str, agent: str = None, provider: str = None, model: str = None,
+                     rules: str = None, stdout: TextIO = None, stderr: TextIO = None,
+                     cancel_event: threading.Event = None, interactive: bool = True) -> int:
+    """
+    Run instructions with a fresh interpreter for an agent, like `eagle run` would.
+
+    Output goes to the given streams instead of the process's own. Setting cancel_event
+    stops the run before its next model request or tool call. With interactive=False the
+    agent never prompts: tools that require permission are denied. Returns the exit code
+    the equivalent `eagle run` process would have had.
+    """
+    from .config import load_config
+    from .interpreter import EagleInterpreter
+
+    stdout = stdout if stdout is not None else io.StringIO()
+    stderr = stderr if stderr is not None else io.StringIO()
+
+    # The new interpreter registers itself with the tool registry; hand it back afterwards
+    parent_interpreter = tool_registry.get_interpreter()
+    interpreter = None
+    with _capture_output(stdout, stderr):
+        try:
+            config = load_config(agent)
+            interpreter = EagleInterpreter(
+                provider=provider or config.get("provider"),
+                model_name=model or config.get("model"),
+                rules=rules.split() if rules else config.get("rules"),
+                config=config,
+                interactive=interactive
+            )
+            interpreter.cancel_event = cancel_event
+            interpreter.execute_instructions(instructions)
+            return 0
+        except SystemExit as e:
+            # The interpreter exits on fatal errors
+            if e.code is None or isinstance(e.code, int):
+                return e.code or 0
+            print(e.code, file=sys.stderr)
+            return 1
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        finally:
+            # A cancelled run may finish after another one has registered itself
+            if interpreter is None or tool_registry.get_interpreter() is interpreter:
+                tool_registry.set_interpreter(parent_interpreter)
+
+
+class _MessageWriter(io.TextIOBase):
+    """Text stream that forwards every write as an output message."""
+
+    def __init__(self, name: str, emit):
+        super().__init__()
+        self._name = name
+        self._emit = emit
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            self._emit({"stream": self._name, "data": text})
+        return len(text)
+
+
+def serve_stdio() -> None:
+    """
+    Serve agent jobs over stdin/stdout until stdin closes.
+
+    Each request is a message with "instructions" and optional "agent", "provider",
+    "model" and "rules". Output is streamed back as {"stream": "stdout"|"stderr", "data": ...}
+    messages, followed by {"exit": code} when the job finishes. Jobs run non-interactively,
+    since stdin carries the protocol, so tools that require permission are denied.
+    """
+    requests = sys.stdin.buffer
+    responses = sys.stdout.buffer
+
+    # stdin/stdout carry the protocol: keep stray prints and prompts off them
+    sys.stdout = sys.stderr
+    sys.stdin = open(os.devnull, "r")
+
+    lock = threading.Lock()
+
+    def emit(message: Dict[str, Any]) -> None:
+        with lock:
+            write_message(responses, message)
+
+    while True:
+        job = read_message(requests)
+        if job is None:
+            return
+
+        exit_code = run_instructions(
+            job.get("instructions", ""),
+            agent=job.get("agent"),
+            provider=job.get("provider"),
+            model=job.get("model"),
+            rules=job.get("rules"),
+            stdout=_MessageWriter("stdout", emit),
+            stderr=_MessageWriter("stderr", emit),
+            interactive=False,
+        )
+        emit({"exit": exit_code})
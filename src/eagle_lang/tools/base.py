@@ -4,7 +4,7 @@ import os
 import sys
 import importlib.util
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, KeysView, List
 
 
 class EagleTool(ABC):
@@ -73,6 +73,10 @@ class ToolRegistry:
         """Register a tool."""
         self._tools[tool.name] = tool
     
+    def clear(self):
+        """Unregister all tools."""
+        self._tools.clear()
+    
     def get(self, name: str) -> EagleTool:
         """Get a tool by name."""
         return self._tools.get(name)
@@ -89,6 +93,11 @@ class ToolRegistry:
         """List all registered tool names."""
         return list(self._tools.keys())
     
+    @property
+    def names_set(self) -> KeysView:
+        """Set-like live view of registered tool names for O(1) membership checks."""
+        return self._tools.keys()
+    
     def get_openai_functions(self) -> List[Dict[str, Any]]:
         """Get all tools in OpenAI function calling format."""
         return [tool.to_openai_function() for tool in self._tools.values()]
@@ -11,7 +11,8 @@ with patch.dict('sys.modules', {
     'google.generativeai': MagicMock(),
     'python-dotenv': MagicMock()
 }):
-    from eagle_lang.cli import main, start_interactive_mode, _initialize_tools
+    import eagle_lang.cli as cli_module
+    from eagle_lang.cli import main, start_interactive_mode, _initialize_tools, _reset_tools
 
 
 class TestCLI(unittest.TestCase):
@@ -26,6 +27,22 @@ class TestCLI(unittest.TestCase):
         """Clean up after each test."""
         sys.argv = self.original_argv
 
+    @patch.object(cli_module, 'tool_registry')
+    def test_initialize_tools_runs_once(self, mock_tool_registry):
+        """Test that tool directories are only walked once per process."""
+        _reset_tools()
+        _initialize_tools()
+        _initialize_tools()
+        
+        self.assertEqual(mock_tool_registry.load_tools_from_directory.call_count, 3)
+        
+        _reset_tools()
+        _initialize_tools()
+        
+        mock_tool_registry.clear.assert_called()
+        self.assertEqual(mock_tool_registry.load_tools_from_directory.call_count, 6)
+        _reset_tools()
+    
     # TODO: Re-add these tests with proper mocking to avoid real API calls and interactive prompts
     # The following tests were removed due to issues with:
     # 1. Real API key requirements
@@ -8,7 +8,8 @@ from unittest.mock import patch, mock_open, MagicMock
 
 # Mock dotenv before importing config
 with patch.dict('sys.modules', {'dotenv': MagicMock()}):
-    from eagle_lang.config import load_config, get_default_config
+    import eagle_lang.config as config_module
+    from eagle_lang.config import load_config, get_default_config, _read_json
 
 
 class TestConfig(unittest.TestCase):
@@ -92,6 +93,43 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config["model"], "gpt-4")
         self.assertEqual(config["max_tokens"], 4000)
     
+    def test_read_json_cache_returns_copies_and_tracks_mtime(self):
+        """Test that cached config reads are isolated and refreshed on file change."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "eagle_config.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"agents": [{"name": "a"}]}, f)
+            
+            first = _read_json(path)
+            first["agents"].append({"name": "mutated"})
+            self.assertEqual(_read_json(path), {"agents": [{"name": "a"}]})
+            
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"agents": [{"name": "b"}]}, f)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            
+            self.assertEqual(_read_json(path), {"agents": [{"name": "b"}]})
+    
+    def test_load_config_precedence(self):
+        """Test project config wins over user config, which wins over defaults."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = os.path.join(temp_dir, "project.json")
+            user_path = os.path.join(temp_dir, "user.json")
+            with open(user_path, "w", encoding="utf-8") as f:
+                json.dump({"agents": [{"name": "user-agent"}]}, f)
+            
+            with patch.object(config_module, 'PROJECT_CONFIG_PATH', project_path), \
+                 patch.object(config_module, 'USER_CONFIG_PATH', user_path):
+                self.assertEqual(load_config()["name"], "user-agent")
+                
+                with open(project_path, "w", encoding="utf-8") as f:
+                    json.dump({"agents": [{"name": "project-agent"}]}, f)
+                self.assertEqual(load_config()["name"], "project-agent")
+                
+                os.unlink(project_path)
+                os.unlink(user_path)
+                self.assertEqual(load_config()["name"], get_default_config()["agents"][0]["name"])
     
     def test_tools_config_structure(self):
         """Test that tools config has correct structure."""
@@ -0,0 +1,283 @@
+"""Tests for Eagle init setup."""
+
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import eagle_lang.config as config_module
+import eagle_lang.init as init_module
+from eagle_lang.config import get_default_config
+from eagle_lang.init import _write_env_key, eagle_init, update_tools
+from eagle_lang.providers import get_provider_api_key_env, get_provider_models
+
+
+class TestScriptedInit(unittest.TestCase):
+    """Test eagle init driven by a TOML file instead of prompts."""
+
+    def setUp(self):
+        """Run each test in a temporary project directory and home."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.project_dir = os.path.join(temp_dir.name, "project")
+        self.home_dir = os.path.join(temp_dir.name, "home")
+        os.makedirs(self.project_dir)
+        os.makedirs(self.home_dir)
+        self.toml_path = os.path.join(temp_dir.name, "setup.toml")
+
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.project_dir)
+
+        project_eagle_dir = os.path.join(self.project_dir, ".eagle")
+        user_eagle_dir = os.path.join(self.home_dir, ".eagle")
+        patches = [
+            patch.dict(os.environ, {"HOME": self.home_dir}),
+            # Config paths are resolved at import time
+            patch.object(config_module, "PROJECT_EAGLE_DIR", project_eagle_dir),
+            patch.object(config_module, "PROJECT_CONFIG_PATH", os.path.join(project_eagle_dir, "eagle_config.json")),
+            patch.object(config_module, "USER_EAGLE_DIR", user_eagle_dir),
+            patch.object(config_module, "USER_CONFIG_PATH", os.path.join(user_eagle_dir, "eagle_config.json")),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        stdout_patch = patch("sys.stdout", new_callable=io.StringIO)
+        self.output = stdout_patch.start()
+        self.addCleanup(stdout_patch.stop)
+
+    def _run_init(self, toml: str, global_install: bool = False) -> str:
+        """Write the TOML answers, run eagle init, and return the .eagle directory it filled."""
+        with open(self.toml_path, "w") as f:
+            f.write(toml)
+        eagle_init(global_install=global_install, config_path=self.toml_path)
+        return os.path.join(self.home_dir if global_install else self.project_dir, ".eagle")
+
+    def _read_agent(self, eagle_dir: str) -> dict:
+        with open(os.path.join(eagle_dir, "eagle_config.json")) as f:
+            return json.load(f)["agents"][0]
+
+    def test_settings_written_from_toml(self):
+        """Test the TOML answers end up in eagle_config.json and .env."""
+        model = get_provider_models("claude")[0]
+        eagle_dir = self._run_init(
+            'provider = "Claude"\n'
+            f'model = "{model}"\n'
+            'rules = "a.md, b.md"\n'
+            'tools = ["print", "read"]\n'
+            'api_key = "sk-test"\n'
+        )
+
+        agent = self._read_agent(eagle_dir)
+        self.assertEqual(agent["provider"], "claude")
+        self.assertEqual(agent["model"], model)
+        self.assertEqual(agent["rules"], ["a.md", "b.md"])
+        self.assertEqual(agent["tools"], ["print", "read"])
+        with open(os.path.join(eagle_dir, ".env")) as f:
+            self.assertEqual(f.read(), f"{get_provider_api_key_env('claude')}=sk-test\n")
+        self.assertTrue(os.path.isfile(os.path.join(eagle_dir, "eagle_rules.md")))
+        self.assertTrue(os.path.isdir(os.path.join(eagle_dir, "tools")))
+
+    def test_missing_settings_use_default_agent(self):
+        """Test settings left out of the TOML come from the packaged default agent."""
+        eagle_dir = self._run_init('api_key = "sk-test"\n')
+
+        default_agent = get_default_config()["agents"][0]
+        agent = self._read_agent(eagle_dir)
+        for key in ("provider", "model", "rules", "tools"):
+            self.assertEqual(agent[key], default_agent[key])
+        with open(os.path.join(eagle_dir, ".env")) as f:
+            self.assertEqual(f.read(), f"{get_provider_api_key_env(default_agent['provider'])}=sk-test\n")
+
+    def test_install_steps_write_everything_in_order(self):
+        """Test the concurrent install writes rules, tools and .env and reports them in step order."""
+        copy_rules = init_module._copy_default_rules
+
+        def slow_copy_rules(*args):
+            # Finish last so reporting order cannot just follow completion order
+            time.sleep(0.1)
+            return copy_rules(*args)
+
+        default_config_dir = os.path.join(os.path.dirname(init_module.__file__), "default_config")
+        with patch.object(init_module, "_copy_default_rules", side_effect=slow_copy_rules):
+            eagle_dir = self._run_init('api_key = "sk-test"\n')
+
+        with open(os.path.join(default_config_dir, "eagle_rules.md")) as default, \
+                open(os.path.join(eagle_dir, "eagle_rules.md")) as installed:
+            self.assertEqual(installed.read(), default.read())
+        self.assertEqual(sorted(os.listdir(os.path.join(eagle_dir, "tools"))),
+                         sorted(os.listdir(os.path.join(default_config_dir, "tools"))))
+        self.assertTrue(os.path.isfile(os.path.join(eagle_dir, ".env")))
+
+        output = self.output.getvalue()
+        positions = [output.index(message) for message in (
+            "📋 Copied default rules to:", "🔧 Copied default tools to:", "✅ API key saved to",
+            "🎉 Eagle configuration complete!")]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_global_install(self):
+        """Test a global install writes to the home .eagle folder only."""
+        eagle_dir = self._run_init('provider = "openai"\n', global_install=True)
+
+        self.assertEqual(self._read_agent(eagle_dir)["provider"], "openai")
+        self.assertFalse(os.path.exists(os.path.join(eagle_dir, ".env")))
+        self.assertFalse(os.path.exists(os.path.join(self.project_dir, ".eagle")))
+
+    def _make_web_cache(self) -> str:
+        """Create the web tool's disk cache, which lives in ~/.eagle without an install."""
+        cache_file = os.path.join(self.home_dir, ".eagle", "cache", "web", "cache.db")
+        os.makedirs(os.path.dirname(cache_file))
+        open(cache_file, "w").close()
+        return cache_file
+
+    def test_web_cache_is_not_an_existing_install(self):
+        """Test a ~/.eagle holding only the web cache gets installed into, not cancelled or moved."""
+        cache_file = self._make_web_cache()
+
+        # on_existing defaults to cancel, so a misdetected install would stop here
+        eagle_dir = self._run_init('provider = "openai"\n', global_install=True)
+
+        self.assertNotIn("Found existing global .eagle directory", self.output.getvalue())
+        self.assertEqual(self._read_agent(eagle_dir)["provider"], "openai")
+        self.assertTrue(os.path.isfile(cache_file))
+
+    def test_update_tools_ignores_web_cache(self):
+        """Test update-tools does not offer a global install that is only the web cache."""
+        self._run_init('provider = "openai"\n')
+        self._make_web_cache()
+
+        with patch("builtins.input", side_effect=AssertionError("should not ask which install")):
+            update_tools()
+
+        output = self.output.getvalue()
+        self.assertIn("Project:", output)
+        self.assertNotIn("Global:", output)
+
+
+class TestWriteEnvKey(unittest.TestCase):
+    """Test saving the API key into .eagle/.env."""
+
+    def setUp(self):
+        """Give each test its own .env path."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.env_path = os.path.join(temp_dir.name, ".env")
+
+    def _write_env(self, content: str) -> None:
+        with open(self.env_path, "w") as f:
+            f.write(content)
+
+    def _read_env(self) -> str:
+        with open(self.env_path) as f:
+            return f.read()
+
+    def test_replaces_existing_key(self):
+        """Test an existing key is updated in place and other lines are kept."""
+        self._write_env("A=1\nOPENAI_API_KEY=old\nB=2\n")
+
+        messages = _write_env_key(self.env_path, True, "OPENAI_API_KEY", "new")
+
+        self.assertEqual(self._read_env(), "A=1\nOPENAI_API_KEY=new\nB=2\n")
+        self.assertEqual(messages, [f"✅ API key saved to {self.env_path}"])
+
+    def test_appends_missing_key(self):
+        """Test a new key is appended on its own line, even without a trailing newline."""
+        self._write_env("A=1")
+
+        _write_env_key(self.env_path, True, "OPENAI_API_KEY", "new")
+
+        self.assertEqual(self._read_env(), "A=1\nOPENAI_API_KEY=new\n")
+
+    def test_creates_env_file(self):
+        """Test the .env file is created when there is none yet."""
+        _write_env_key(self.env_path, False, "OPENAI_API_KEY", "new")
+
+        self.assertEqual(self._read_env(), "OPENAI_API_KEY=new\n")
+
+    def test_backslashes_in_key_kept_literally(self):
+        """Test backslashes in the key are written as-is, not treated as regex escapes."""
+        self._write_env("OPENAI_API_KEY=old\n")
+        key = r"sk-\1\g<0>\n"
+
+        _write_env_key(self.env_path, True, "OPENAI_API_KEY", key)
+
+        self.assertEqual(self._read_env(), f"OPENAI_API_KEY={key}\n")
+
+    def test_no_key_leaves_file_alone(self):
+        """Test nothing is written when no API key was entered."""
+        self._write_env("A=1\n")
+
+        self.assertEqual(_write_env_key(self.env_path, True, "OPENAI_API_KEY", None), [])
+        self.assertEqual(self._read_env(), "A=1\n")
+
+
+
+class TestOutputBuffering(unittest.TestCase):
+    """Test that queued init output is written before prompts and on return."""
+
+    def setUp(self):
+        """Capture stdout and start with an empty output queue."""
+        init_module._output_buffer.clear()
+        self.addCleanup(init_module._output_buffer.clear)
+        stdout_patch = patch("sys.stdout", new_callable=io.StringIO)
+        self.output = stdout_patch.start()
+        self.addCleanup(stdout_patch.stop)
+
+    def _input_recording_output(self, answer: str):
+        """Patch input() to record what had been written to stdout when it was called."""
+        seen = []
+
+        def fake_input(prompt):
+            seen.append(self.output.getvalue())
+            return answer
+        return patch("builtins.input", side_effect=fake_input), seen
+
+    def test_output_flushed_before_input(self):
+        """Test queued lines are written, in one go, before the prompt is shown."""
+        input_patch, seen = self._input_recording_output("y")
+
+        init_module._print("Step 1")
+        init_module._print("Step 2")
+        self.assertEqual(self.output.getvalue(), "")
+        with input_patch:
+            answer = init_module._input("Continue? ")
+
+        self.assertEqual(answer, "y")
+        self.assertEqual(seen, ["Step 1\nStep 2\n"])
+
+    def test_output_flushed_when_function_returns_or_raises(self):
+        """Test decorated functions write queued output however they exit."""
+        @init_module._flushes_output
+        def setup(fail):
+            init_module._print("failing" if fail else "done")
+            if fail:
+                raise RuntimeError("boom")
+
+        setup(False)
+        self.assertEqual(self.output.getvalue(), "done\n")
+        with self.assertRaises(RuntimeError):
+            setup(True)
+        self.assertEqual(self.output.getvalue(), "done\nfailing\n")
+
+    def test_eagle_init_shows_welcome_before_first_prompt(self):
+        """Test eagle init output queued so far is visible when it first asks something."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        os.makedirs(os.path.join(temp_dir.name, ".eagle"))
+        open(os.path.join(temp_dir.name, ".eagle", "eagle_config.json"), "w").close()
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(temp_dir.name)
+        input_patch, seen = self._input_recording_output("cancel")
+
+        # Never write a config into the real working directory if setup gets further than expected
+        with input_patch, patch.object(init_module, "save_config"):
+            eagle_init()
+
+        self.assertIn("Welcome to Eagle Setup!", seen[0])
+        self.assertIn("Found existing .eagle directory", seen[0])
+        self.assertTrue(self.output.getvalue().endswith("Setup cancelled.\n"))
+
+
+if __name__ == '__main__':
+    unittest.main()
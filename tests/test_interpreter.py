@@ -3,6 +3,7 @@
 import unittest
 import tempfile
 import os
+import threading
 from unittest.mock import patch, MagicMock, mock_open
 
 # Mock dependencies before importing
@@ -11,6 +12,7 @@ with patch.dict('sys.modules', {
     'anthropic': MagicMock(),
     'google.generativeai': MagicMock()
 }):
+    import eagle_lang.interpreter as interpreter_module
     from eagle_lang.interpreter import EagleInterpreter
 
 
@@ -246,5 +248,105 @@ class TestInterpreterProviders(unittest.TestCase):
     #     """Test that missing API key raises appropriate error."""
 
 
+class TestToolPermissions(unittest.TestCase):
+    """Test permission-required tools in non-interactive and cancelled runs."""
+    
+    def setUp(self):
+        """Patch out providers and the tool registry; "shell" requires permission."""
+        self.tool = MagicMock()
+        self.tool.execute.return_value = "ran"
+        self.config = {"provider": "openai", "model": "gpt-4", "rules": [],
+                       "tools": {"allowed": [], "require_permission": ["shell"]}, "max_tokens": 100}
+        
+        mock_registry = MagicMock()
+        mock_registry.names_set = {"shell"}
+        mock_registry.get.return_value = self.tool
+        patches = [
+            patch.object(interpreter_module, 'get_default_config', return_value=self.config),
+            patch.object(interpreter_module, 'tool_registry', mock_registry),
+            patch.object(interpreter_module, 'get_provider_config', return_value={"api_key_env": "OPENAI_API_KEY"}),
+            patch.object(interpreter_module, '_create_client'),
+            patch.dict(os.environ, {"OPENAI_API_KEY": "key"}),
+            patch('builtins.print'),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+    
+    def _shell_call(self) -> MagicMock:
+        tool_call = MagicMock()
+        tool_call.function.name = "shell"
+        tool_call.function.arguments = '{"command": "ls"}'
+        return tool_call
+    
+    def test_permission_denied_without_prompting(self):
+        """Test permission-required tools are denied instead of reading stdin."""
+        interpreter = EagleInterpreter(config=self.config, interactive=False)
+        interpreter.client.chat.completions.create.return_value.choices[0].message.tool_calls = None
+        messages = []
+        
+        with patch('builtins.input', side_effect=EOFError) as mock_input:
+            interpreter._handle_tool_calls([self._shell_call()], messages)
+        
+        mock_input.assert_not_called()
+        self.tool.execute.assert_not_called()
+        self.assertEqual(messages[1]["content"],
+                         "Tool 'shell' execution denied: permission cannot be requested in a non-interactive run")
+    
+    def test_permission_granted_after_cancel_does_not_run_tool(self):
+        """Test a run cancelled while blocked on the permission prompt never runs the tool."""
+        interpreter = EagleInterpreter(config=self.config)
+        interpreter.cancel_event = threading.Event()
+        prompting, answer = threading.Event(), threading.Event()
+        
+        def blocked_input(prompt):
+            prompting.set()
+            answer.wait(5)
+            # An answer meant for someone else once this run was given up on
+            return "y"
+        
+        errors = []
+        
+        def run():
+            try:
+                interpreter._handle_tool_calls([self._shell_call()], [])
+            except Exception as e:
+                errors.append(e)
+        
+        with patch('builtins.input', side_effect=blocked_input):
+            worker = threading.Thread(target=run)
+            worker.start()
+            self.assertTrue(prompting.wait(5))
+            interpreter.cancel_event.set()
+            answer.set()
+            worker.join(5)
+        
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], interpreter_module.AgentCancelled)
+        self.tool.execute.assert_not_called()
+        interpreter.client.chat.completions.create.assert_not_called()
+
+
+class TestClientCache(unittest.TestCase):
+    """Test provider client reuse across interpreters."""
+    
+    def setUp(self):
+        """Start each test with an empty client cache."""
+        interpreter_module._create_client.cache_clear()
+        self.addCleanup(interpreter_module._create_client.cache_clear)
+    
+    def test_clients_shared_per_provider_and_key(self):
+        """Test interpreters with the same provider and key reuse one client."""
+        with patch.object(interpreter_module, 'OpenAI', side_effect=lambda **kwargs: MagicMock()) as mock_openai:
+            first = interpreter_module._create_client("openai", "key-1")
+            second = interpreter_module._create_client("openai", "key-1")
+            other_key = interpreter_module._create_client("openai", "key-2")
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_key)
+        self.assertEqual(mock_openai.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,85 @@
+"""Tests for the Eagle stdio agent worker."""
+
+import io
+import sys
+import unittest
+from unittest.mock import patch
+import eagle_lang.serve as serve_module
+from eagle_lang.serve import read_message, write_message, serve_stdio
+
+
+class _Stdio:
+    """Stand-in for a text stdio stream that exposes a binary buffer."""
+
+    def __init__(self, data: bytes = b""):
+        self.buffer = io.BytesIO(data)
+
+
+class TestMessages(unittest.TestCase):
+    """Test length-prefixed message framing."""
+
+    def test_round_trip(self):
+        """Test messages read back in order and end cleanly."""
+        stream = io.BytesIO()
+        write_message(stream, {"instructions": "hello ✓"})
+        write_message(stream, {"exit": 0})
+        stream.seek(0)
+
+        self.assertEqual(read_message(stream), {"instructions": "hello ✓"})
+        self.assertEqual(read_message(stream), {"exit": 0})
+        self.assertIsNone(read_message(stream))
+
+    def test_truncated_message(self):
+        """Test a partial message is an error rather than end of stream."""
+        stream = io.BytesIO()
+        write_message(stream, {"exit": 0})
+
+        with self.assertRaises(EOFError):
+            read_message(io.BytesIO(stream.getvalue()[:-1]))
+
+
+class TestServeStdio(unittest.TestCase):
+    """Test the serve loop."""
+
+    def test_serves_jobs_until_stdin_closes(self):
+        """Test each job streams its output and then reports its exit code."""
+        requests = io.BytesIO()
+        write_message(requests, {"instructions": "first", "agent": "helper"})
+        write_message(requests, {"instructions": "second"})
+
+        def fake_run(instructions, agent=None, provider=None, model=None, rules=None,
+                     stdout=None, stderr=None, interactive=True):
+            # stdin carries the protocol, so jobs must never prompt
+            self.assertFalse(interactive)
+            print(f"ran {instructions}", file=stdout)
+            if agent is None:
+                stderr.write("no agent")
+                return 1
+            return 0
+
+        stdin, stdout = _Stdio(requests.getvalue()), _Stdio()
+        with patch.object(serve_module, 'run_instructions', side_effect=fake_run), \
+                patch.object(sys, 'stdin', stdin), patch.object(sys, 'stdout', stdout):
+            serve_stdio()
+
+        stdout.buffer.seek(0)
+        messages = []
+        while True:
+            message = read_message(stdout.buffer)
+            if message is None:
+                break
+            messages.append(message)
+
+        self.assertEqual(messages, [
+            {"stream": "stdout", "data": "ran first"},
+            {"stream": "stdout", "data": "\n"},
+            {"exit": 0},
+            {"stream": "stdout", "data": "ran second"},
+            {"stream": "stdout", "data": "\n"},
+            {"stream": "stderr", "data": "no agent"},
+            {"exit": 1},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -118,6 +118,13 @@ class TestToolRegistry(unittest.TestCase):
         retrieved_tool = tool_registry.get("mock_tool")
         self.assertEqual(retrieved_tool, tool)
     
+    def test_clear(self):
+        """Test clearing the registry removes all tools."""
+        tool_registry.register(MockTool())
+        tool_registry.clear()
+        
+        self.assertEqual(tool_registry.list_tools(), [])
+    
     def test_get_nonexistent_tool(self):
         """Test getting a non-existent tool returns None."""
         result = tool_registry.get("nonexistent_tool")
@@ -142,6 +149,16 @@ class TestToolRegistry(unittest.TestCase):
         self.assertIn("mock_tool", tools)
         self.assertIn("mock_tool_2", tools)
     
+    def test_names_set_tracks_registry(self):
+        """Test names_set reflects registrations without a stale cache."""
+        self.assertNotIn("mock_tool", tool_registry.names_set)
+        
+        tool_registry.register(MockTool())
+        self.assertIn("mock_tool", tool_registry.names_set)
+        
+        tool_registry.clear()
+        self.assertNotIn("mock_tool", tool_registry.names_set)
+    
     def test_get_openai_functions(self):
         """Test getting OpenAI function definitions."""
         tool = MockTool()